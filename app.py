@@ -6,579 +6,690 @@ conscious travel decisions by calculating carbon emissions and suggesting greene
 """
 
 import streamlit as st
+import pandas as pd
 import os
+import traceback
+from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
 from components.ui_components import UIComponents, FormComponents, VisualizationComponents
-from components.session_manager import SessionStateManager
+from components.session_manager import SessionStateManager, SessionSnapshot
 from components.carbon_calculator import CarbonCalculator
 from components.route_analyzer import RouteAnalyzer
-from components.geographic_data import GeographicDataManager
+from components.geographic_data import GeographicDataManager, get_default_manager
+from components.ml_emissions_model import MLEmissionsPredictor
+from components.ml_route_predictor import MLRoutePredictor
+from components.models import TripData, AlternativeRoute
+
+# Connection-closed errors raised when the browser drops the websocket mid-rerun.
+# Streamlit's own RerunException/StopException derive from BaseException and are
+# deliberately not caught here so that st.rerun() keeps working.
+try:
+    from tornado.iostream import StreamClosedError
+    from tornado.websocket import WebSocketClosedError
+    _CONNECTION_CLOSED_ERRORS = (StreamClosedError, WebSocketClosedError)
+except ImportError:
+    _CONNECTION_CLOSED_ERRORS = ()
 
 # Load environment variables
 load_dotenv()
 
-def main():
-    """Main application entry point with comprehensive error handling and complete workflow"""
-    try:
-        # Configure Streamlit page with eco-friendly settings
-        configure_streamlit_app()
-        
-        # Apply comprehensive eco-themed styling
-        apply_eco_styling()
-        
-        # Initialize session state with error handling
-        try:
-            SessionStateManager.initialize_session()
-        except Exception as e:
-            st.error("⚠️ Failed to initialize session. Please refresh the page.")
-            st.sidebar.error(f"Session Error: {str(e)}")
-            return
-        
-        # Render main application header with enhanced styling
-        render_enhanced_header()
-        
-        # Main application workflow
-        handle_main_workflow()
-        
-        # Sidebar with status and configuration
-        render_sidebar_content()
-            
-    except Exception as e:
-        # Handle WebSocket errors gracefully
-        error_msg = str(e)
-        error_type = type(e).__name__
-        
-        # Check for WebSocket-related errors
-        if 'WebSocket' in error_type or 'websocket' in error_msg.lower() or 'StreamClosed' in error_type:
-            # WebSocket errors are usually harmless - just log and continue
-            # They occur when the connection closes during rerun operations
-            pass  # Silently ignore WebSocket errors as they're typically harmless
-        else:
-            # Catch-all error handler for other errors
-            handle_critical_error(e)
+# Static eco-theme stylesheet, injected on every rerun by apply_eco_styling()
+_ECO_CSS = """
+/* Main app styling */
+.stApp {
+    background: linear-gradient(135deg, #f0f8f0 0%, #e8f5e8 100%);
+}
 
-def configure_streamlit_app():
-    """Configure Streamlit application settings with deployment-ready options"""
-    # Get configuration from environment variables with defaults
-    page_title = os.getenv('STREAMLIT_PAGE_TITLE', ' EcoTrip Planner - Sustainable Travel Calculator')
-    page_icon = os.getenv('STREAMLIT_PAGE_ICON', '🌱')
-    layout = os.getenv('STREAMLIT_LAYOUT', 'wide')
-    sidebar_state = os.getenv('STREAMLIT_SIDEBAR_STATE', 'expanded')
-    
-    st.set_page_config(
-        page_title=page_title,
-        page_icon=page_icon,
-        layout=layout,
-        initial_sidebar_state=sidebar_state,
-        menu_items={
-            'Get Help': 'https://github.com/ecotrip-planner/help',
-            'Report a bug': 'https://github.com/ecotrip-planner/issues',
-            'About': "EcoTrip Planner helps you make sustainable travel choices by calculating carbon emissions and suggesting greener alternatives for travel within India."
-        }
-    )
-    
-    # Set additional configuration based on environment
-    if os.getenv('STREAMLIT_THEME_BASE'):
-        st._config.set_option('theme.base', os.getenv('STREAMLIT_THEME_BASE'))
-    
-    # Configure caching and performance settings
-    if os.getenv('STREAMLIT_SERVER_MAX_UPLOAD_SIZE'):
-        st._config.set_option('server.maxUploadSize', int(os.getenv('STREAMLIT_SERVER_MAX_UPLOAD_SIZE')))
-    
-    # Development vs Production settings
-    is_production = os.getenv('ENVIRONMENT', 'development').lower() == 'production'
-    
-    if is_production:
-        # Production settings
-        st._config.set_option('global.developmentMode', False)
-        st._config.set_option('client.showErrorDetails', False)
-        st._config.set_option('browser.gatherUsageStats', False)
-    else:
-        # Development settings
-        st._config.set_option('global.developmentMode', True)
-        st._config.set_option('client.showErrorDetails', True)
+/* Header styling */
+.main-header {
+    background: linear-gradient(90deg, #2E8B57 0%, #228B22 100%);
+    padding: 2rem;
+    border-radius: 15px;
+    margin-bottom: 2rem;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+}
 
-def apply_eco_styling():
-    """Apply comprehensive eco-themed styling with green colors and environmental design"""
-    st.markdown("""
-    <style>
-    /* Main app styling */
-    .stApp {
-        background: linear-gradient(135deg, #f0f8f0 0%, #e8f5e8 100%);
+.main-header h1 {
+    color: white;
+    text-align: center;
+    margin: 0;
+    font-size: 2.5rem;
+    word-wrap: break-word;
+}
+
+.main-header p {
+    color: #f0f8f0;
+    text-align: center;
+    margin: 0.5rem 0 0 0;
+    font-size: 1.2rem;
+    word-wrap: break-word;
+}
+
+/* Form styling */
+.stForm {
+    background-color: #ffffff;
+    padding: 2rem;
+    border-radius: 15px;
+    border: 3px solid #90EE90;
+    box-shadow: 0 4px 12px rgba(46, 139, 87, 0.15);
+    margin-bottom: 2rem;
+}
+
+/* Input fields styling for better mobile experience */
+.stTextInput > div > div > input,
+.stSelectbox > div > div > select,
+.stNumberInput > div > div > input,
+.stDateInput > div > div > input {
+    min-height: 44px; /* Minimum touch target size for mobile */
+    font-size: 16px; /* Prevents zoom on iOS */
+}
+
+/* Button styling - touch-friendly */
+.stButton > button {
+    background: linear-gradient(90deg, #32CD32 0%, #228B22 100%);
+    color: white;
+    border: none;
+    border-radius: 25px;
+    padding: 0.75rem 2rem;
+    font-weight: bold;
+    transition: all 0.3s ease;
+    min-height: 44px; /* Minimum touch target size */
+    width: 100%;
+    max-width: 100%;
+}
+
+.stButton > button:hover {
+    background: linear-gradient(90deg, #228B22 0%, #006400 100%);
+    transform: translateY(-2px);
+    box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+}
+
+.stButton > button:active {
+    transform: translateY(0);
+}
+
+/* Metric styling */
+.metric-container {
+    background: linear-gradient(135deg, #ffffff 0%, #f8fff8 100%);
+    padding: 1.5rem;
+    border-radius: 12px;
+    border-left: 5px solid #32CD32;
+    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
+    margin: 1rem 0;
+}
+
+/* Success/Info message styling */
+.stSuccess {
+    background-color: #d4edda;
+    border: 1px solid #c3e6cb;
+    border-radius: 10px;
+    padding: 1rem;
+}
+
+.stInfo {
+    background-color: #e8f4f8;
+    border: 1px solid #bee5eb;
+    border-radius: 10px;
+    padding: 1rem;
+}
+
+/* Sidebar styling */
+.css-1d391kg {
+    background: linear-gradient(180deg, #f0f8f0 0%, #e8f5e8 100%);
+}
+
+/* Chart container styling */
+.chart-container {
+    background: white;
+    padding: 1.5rem;
+    border-radius: 12px;
+    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
+    margin: 1rem 0;
+    width: 100%;
+    max-width: 100%;
+    overflow-x: auto;
+}
+
+/* Make Plotly charts responsive */
+.js-plotly-plot {
+    max-width: 100% !important;
+    height: auto !important;
+}
+
+/* Fix Plotly chart title overlap with toolbar */
+.js-plotly-plot .plotly .modebar {
+    top: 5px !important;
+    right: 5px !important;
+}
+
+.js-plotly-plot .plotly .gtitle {
+    margin-top: 10px !important;
+}
+
+/* Mobile-specific Plotly fixes */
+@media (max-width: 768px) {
+    .js-plotly-plot .plotly .modebar {
+        top: 2px !important;
+        right: 2px !important;
+        font-size: 12px !important;
     }
     
-    /* Header styling */
+    .js-plotly-plot .plotly .gtitle {
+        margin-top: 15px !important;
+        font-size: 14px !important;
+    }
+    
+    .js-plotly-plot .plotly .modebar-btn {
+        width: 20px !important;
+        height: 20px !important;
+    }
+}
+
+/* Tab styling */
+.stTabs [data-baseweb="tab-list"] {
+    gap: 8px;
+    flex-wrap: wrap; /* Allow tabs to wrap on small screens */
+}
+
+.stTabs [data-baseweb="tab"] {
+    background-color: #f0f8f0;
+    border-radius: 8px;
+    padding: 0.5rem 1rem;
+    border: 2px solid transparent;
+    min-height: 44px; /* Touch-friendly */
+    font-size: 0.9rem;
+}
+
+.stTabs [aria-selected="true"] {
+    background-color: #32CD32;
+    color: white;
+    border-color: #228B22;
+}
+
+/* Loading spinner styling */
+.stSpinner > div {
+    border-top-color: #32CD32 !important;
+}
+
+/* Progress bar styling */
+.stProgress .st-bo {
+    background-color: #32CD32;
+}
+
+/* Expander styling */
+.streamlit-expanderHeader {
+    background-color: #f0f8f0;
+    border-radius: 8px;
+    min-height: 44px; /* Touch-friendly */
+}
+
+/* Custom eco badges */
+.eco-badge {
+    display: inline-block;
+    background: linear-gradient(90deg, #32CD32 0%, #228B22 100%);
+    color: white;
+    padding: 0.3rem 0.8rem;
+    border-radius: 15px;
+    font-size: 0.8rem;
+    font-weight: bold;
+    margin: 0.2rem;
+}
+
+.warning-badge {
+    display: inline-block;
+    background: linear-gradient(90deg, #FFA500 0%, #FF8C00 100%);
+    color: white;
+    padding: 0.3rem 0.8rem;
+    border-radius: 15px;
+    font-size: 0.8rem;
+    font-weight: bold;
+    margin: 0.2rem;
+}
+
+/* Dataframe/table styling for mobile */
+.stDataFrame {
+    width: 100%;
+    overflow-x: auto;
+    display: block;
+}
+
+/* Column containers - responsive */
+[data-testid="column"] {
+    width: 100% !important;
+    min-width: 0 !important;
+}
+
+/* ============================================
+   RESPONSIVE DESIGN - MOBILE & TABLET
+   ============================================ */
+
+/* Mobile devices (max-width: 768px) */
+@media screen and (max-width: 768px) {
+    /* Header adjustments */
     .main-header {
-        background: linear-gradient(90deg, #2E8B57 0%, #228B22 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        padding: 1.5rem 1rem;
+        border-radius: 10px;
+        margin-bottom: 1.5rem;
     }
     
     .main-header h1 {
-        color: white;
-        text-align: center;
-        margin: 0;
-        font-size: 2.5rem;
-        word-wrap: break-word;
+        font-size: 1.75rem;
+        line-height: 1.3;
     }
     
     .main-header p {
-        color: #f0f8f0;
-        text-align: center;
-        margin: 0.5rem 0 0 0;
-        font-size: 1.2rem;
-        word-wrap: break-word;
+        font-size: 1rem;
+        line-height: 1.4;
     }
     
-    /* Form styling */
+    /* Form adjustments */
     .stForm {
-        background-color: #ffffff;
-        padding: 2rem;
-        border-radius: 15px;
-        border: 3px solid #90EE90;
-        box-shadow: 0 4px 12px rgba(46, 139, 87, 0.15);
-        margin-bottom: 2rem;
+        padding: 1.5rem 1rem;
+        border-radius: 10px;
+        margin-bottom: 1.5rem;
+        border-width: 2px;
     }
     
-    /* Input fields styling for better mobile experience */
-    .stTextInput > div > div > input,
-    .stSelectbox > div > div > select,
-    .stNumberInput > div > div > input,
-    .stDateInput > div > div > input {
-        min-height: 44px; /* Minimum touch target size for mobile */
-        font-size: 16px; /* Prevents zoom on iOS */
+    /* Button full width on mobile */
+    .stButton > button {
+        padding: 0.875rem 1.5rem;
+        font-size: 1rem;
     }
     
-    /* Button styling - touch-friendly */
-    .stButton > button {
-        background: linear-gradient(90deg, #32CD32 0%, #228B22 100%);
-        color: white;
-        border: none;
-        border-radius: 25px;
-        padding: 0.75rem 2rem;
-        font-weight: bold;
-        transition: all 0.3s ease;
-        min-height: 44px; /* Minimum touch target size */
-        width: 100%;
-        max-width: 100%;
+    /* Metric container */
+    .metric-container {
+        padding: 1rem;
+        margin: 0.75rem 0;
     }
     
-    .stButton > button:hover {
-        background: linear-gradient(90deg, #228B22 0%, #006400 100%);
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+    /* Chart container */
+    .chart-container {
+        padding: 1rem;
+        margin: 0.75rem 0;
+        border-radius: 10px;
     }
     
-    .stButton > button:active {
-        transform: translateY(0);
+    /* Success/Info messages */
+    .stSuccess,
+    .stInfo {
+        padding: 0.875rem;
+        font-size: 0.9rem;
     }
     
-    /* Metric styling */
-    .metric-container {
-        background: linear-gradient(135deg, #ffffff 0%, #f8fff8 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        border-left: 5px solid #32CD32;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        margin: 1rem 0;
+    /* Tabs - full width on mobile */
+    .stTabs [data-baseweb="tab"] {
+        flex: 1 1 auto;
+        min-width: 0;
+        padding: 0.5rem 0.75rem;
+        font-size: 0.85rem;
     }
     
-    /* Success/Info message styling */
-    .stSuccess {
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        border-radius: 10px;
-        padding: 1rem;
+    /* Expander */
+    .streamlit-expanderHeader {
+        padding: 0.75rem 1rem;
+        font-size: 0.9rem;
     }
     
-    .stInfo {
-        background-color: #e8f4f8;
-        border: 1px solid #bee5eb;
-        border-radius: 10px;
-        padding: 1rem;
+    /* Badges */
+    .eco-badge,
+    .warning-badge {
+        padding: 0.25rem 0.6rem;
+        font-size: 0.75rem;
+        margin: 0.15rem;
     }
     
-    /* Sidebar styling */
-    .css-1d391kg {
-        background: linear-gradient(180deg, #f0f8f0 0%, #e8f5e8 100%);
+    /* Main container padding */
+    .main .block-container {
+        padding-left: 1rem;
+        padding-right: 1rem;
+        padding-top: 2rem;
+        padding-bottom: 2rem;
     }
     
-    /* Chart container styling */
-    .chart-container {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        margin: 1rem 0;
-        width: 100%;
-        max-width: 100%;
-        overflow-x: auto;
+    /* Sidebar adjustments */
+    .css-1d391kg {
+        padding: 1rem;
     }
     
-    /* Make Plotly charts responsive */
-    .js-plotly-plot {
-        max-width: 100% !important;
-        height: auto !important;
+    /* Hide horizontal scrollbar on mobile when not needed */
+    body {
+        overflow-x: hidden;
     }
     
-    /* Fix Plotly chart title overlap with toolbar */
-    .js-plotly-plot .plotly .modebar {
-        top: 5px !important;
-        right: 5px !important;
+    /* Make tables horizontally scrollable */
+    .stDataFrame > div {
+        overflow-x: auto;
+        -webkit-overflow-scrolling: touch;
+    }
+}
+
+/* Tablet devices (max-width: 1024px) */
+@media screen and (max-width: 1024px) and (min-width: 769px) {
+    /* Header adjustments */
+    .main-header {
+        padding: 1.75rem 1.5rem;
     }
     
-    .js-plotly-plot .plotly .gtitle {
-        margin-top: 10px !important;
+    .main-header h1 {
+        font-size: 2rem;
     }
     
-    /* Mobile-specific Plotly fixes */
-    @media (max-width: 768px) {
-        .js-plotly-plot .plotly .modebar {
-            top: 2px !important;
-            right: 2px !important;
-            font-size: 12px !important;
-        }
-        
-        .js-plotly-plot .plotly .gtitle {
-            margin-top: 15px !important;
-            font-size: 14px !important;
-        }
-        
-        .js-plotly-plot .plotly .modebar-btn {
-            width: 20px !important;
-            height: 20px !important;
-        }
+    .main-header p {
+        font-size: 1.1rem;
     }
     
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        flex-wrap: wrap; /* Allow tabs to wrap on small screens */
+    /* Form adjustments */
+    .stForm {
+        padding: 1.75rem 1.5rem;
     }
     
-    .stTabs [data-baseweb="tab"] {
-        background-color: #f0f8f0;
+    /* Chart container */
+    .chart-container {
+        padding: 1.25rem;
+    }
+}
+
+/* Small mobile devices (max-width: 480px) */
+@media screen and (max-width: 480px) {
+    /* Header adjustments */
+    .main-header {
+        padding: 1.25rem 0.75rem;
         border-radius: 8px;
-        padding: 0.5rem 1rem;
-        border: 2px solid transparent;
-        min-height: 44px; /* Touch-friendly */
-        font-size: 0.9rem;
     }
     
-    .stTabs [aria-selected="true"] {
-        background-color: #32CD32;
-        color: white;
-        border-color: #228B22;
+    .main-header h1 {
+        font-size: 1.5rem;
     }
     
-    /* Loading spinner styling */
-    .stSpinner > div {
-        border-top-color: #32CD32 !important;
+    .main-header p {
+        font-size: 0.9rem;
     }
     
-    /* Progress bar styling */
-    .stProgress .st-bo {
-        background-color: #32CD32;
+    /* Form adjustments */
+    .stForm {
+        padding: 1.25rem 0.75rem;
+        border-radius: 8px;
     }
     
-    /* Expander styling */
-    .streamlit-expanderHeader {
-        background-color: #f0f8f0;
-        border-radius: 8px;
-        min-height: 44px; /* Touch-friendly */
+    /* Button adjustments */
+    .stButton > button {
+        padding: 0.75rem 1.25rem;
+        font-size: 0.95rem;
     }
     
-    /* Custom eco badges */
-    .eco-badge {
-        display: inline-block;
-        background: linear-gradient(90deg, #32CD32 0%, #228B22 100%);
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 15px;
-        font-size: 0.8rem;
-        font-weight: bold;
-        margin: 0.2rem;
+    /* Metric container */
+    .metric-container {
+        padding: 0.875rem;
     }
     
-    .warning-badge {
-        display: inline-block;
-        background: linear-gradient(90deg, #FFA500 0%, #FF8C00 100%);
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 15px;
-        font-size: 0.8rem;
-        font-weight: bold;
-        margin: 0.2rem;
+    /* Chart container */
+    .chart-container {
+        padding: 0.875rem;
     }
     
-    /* Dataframe/table styling for mobile */
-    .stDataFrame {
+    /* Tabs - stack vertically if needed */
+    .stTabs [data-baseweb="tab-list"] {
+        flex-direction: column;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
         width: 100%;
-        overflow-x: auto;
-        display: block;
+        margin-bottom: 0.5rem;
     }
     
-    /* Column containers - responsive */
-    [data-testid="column"] {
-        width: 100% !important;
-        min-width: 0 !important;
+    /* Main container padding */
+    .main .block-container {
+        padding-left: 0.75rem;
+        padding-right: 0.75rem;
+        padding-top: 1.5rem;
+        padding-bottom: 1.5rem;
+    }
+}
+
+/* Landscape orientation on mobile */
+@media screen and (max-width: 768px) and (orientation: landscape) {
+    .main-header {
+        padding: 1rem 1.5rem;
     }
     
-    /* ============================================
-       RESPONSIVE DESIGN - MOBILE & TABLET
-       ============================================ */
+    .main-header h1 {
+        font-size: 1.5rem;
+    }
     
-    /* Mobile devices (max-width: 768px) */
-    @media screen and (max-width: 768px) {
-        /* Header adjustments */
-        .main-header {
-            padding: 1.5rem 1rem;
-            border-radius: 10px;
-            margin-bottom: 1.5rem;
-        }
-        
-        .main-header h1 {
-            font-size: 1.75rem;
-            line-height: 1.3;
-        }
-        
-        .main-header p {
-            font-size: 1rem;
-            line-height: 1.4;
-        }
-        
-        /* Form adjustments */
-        .stForm {
-            padding: 1.5rem 1rem;
-            border-radius: 10px;
-            margin-bottom: 1.5rem;
-            border-width: 2px;
-        }
-        
-        /* Button full width on mobile */
-        .stButton > button {
-            padding: 0.875rem 1.5rem;
-            font-size: 1rem;
-        }
-        
-        /* Metric container */
-        .metric-container {
-            padding: 1rem;
-            margin: 0.75rem 0;
-        }
-        
-        /* Chart container */
-        .chart-container {
-            padding: 1rem;
-            margin: 0.75rem 0;
-            border-radius: 10px;
-        }
-        
-        /* Success/Info messages */
-        .stSuccess,
-        .stInfo {
-            padding: 0.875rem;
-            font-size: 0.9rem;
-        }
-        
-        /* Tabs - full width on mobile */
-        .stTabs [data-baseweb="tab"] {
-            flex: 1 1 auto;
-            min-width: 0;
-            padding: 0.5rem 0.75rem;
-            font-size: 0.85rem;
-        }
-        
-        /* Expander */
-        .streamlit-expanderHeader {
-            padding: 0.75rem 1rem;
-            font-size: 0.9rem;
-        }
-        
-        /* Badges */
-        .eco-badge,
-        .warning-badge {
-            padding: 0.25rem 0.6rem;
-            font-size: 0.75rem;
-            margin: 0.15rem;
-        }
-        
-        /* Main container padding */
-        .main .block-container {
-            padding-left: 1rem;
-            padding-right: 1rem;
-            padding-top: 2rem;
-            padding-bottom: 2rem;
-        }
-        
-        /* Sidebar adjustments */
-        .css-1d391kg {
-            padding: 1rem;
-        }
-        
-        /* Hide horizontal scrollbar on mobile when not needed */
-        body {
-            overflow-x: hidden;
-        }
-        
-        /* Make tables horizontally scrollable */
-        .stDataFrame > div {
-            overflow-x: auto;
-            -webkit-overflow-scrolling: touch;
-        }
+    .main-header p {
+        font-size: 0.9rem;
+    }
+}
+
+/* Large screens (min-width: 1200px) - maintain readability */
+@media screen and (min-width: 1200px) {
+    .main .block-container {
+        max-width: 1200px;
+        padding-left: 3rem;
+        padding-right: 3rem;
+    }
+}
+
+/* Print styles */
+@media print {
+    .main-header {
+        break-inside: avoid;
     }
     
-    /* Tablet devices (max-width: 1024px) */
-    @media screen and (max-width: 1024px) and (min-width: 769px) {
-        /* Header adjustments */
-        .main-header {
-            padding: 1.75rem 1.5rem;
-        }
-        
-        .main-header h1 {
-            font-size: 2rem;
-        }
-        
-        .main-header p {
-            font-size: 1.1rem;
-        }
-        
-        /* Form adjustments */
-        .stForm {
-            padding: 1.75rem 1.5rem;
-        }
-        
-        /* Chart container */
-        .chart-container {
-            padding: 1.25rem;
-        }
+    .stForm {
+        break-inside: avoid;
+        page-break-inside: avoid;
     }
     
-    /* Small mobile devices (max-width: 480px) */
-    @media screen and (max-width: 480px) {
-        /* Header adjustments */
-        .main-header {
-            padding: 1.25rem 0.75rem;
-            border-radius: 8px;
-        }
-        
-        .main-header h1 {
-            font-size: 1.5rem;
-        }
-        
-        .main-header p {
-            font-size: 0.9rem;
-        }
-        
-        /* Form adjustments */
-        .stForm {
-            padding: 1.25rem 0.75rem;
-            border-radius: 8px;
-        }
+    .chart-container {
+        break-inside: avoid;
+        page-break-inside: avoid;
+    }
+}
+"""
+
+# Static header markup used by render_enhanced_header()
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>🌱 EcoTrip Planner</h1>
+    <p>🌍 Make sustainable travel choices with carbon footprint insights for India 🇮🇳</p>
+</div>
+"""
+
+_IMPACT_NOTICE_HTML = """
+<div style="text-align: center; padding: 1rem; background-color: rgba(50, 205, 50, 0.1); 
+            border-radius: 10px; margin-bottom: 2rem;">
+    <strong>🌿 Every sustainable choice counts!</strong><br>
+    <em>Calculate your carbon footprint • Compare alternatives • Travel responsibly</em>
+</div>
+"""
+
+@st.cache_resource
+def _get_eco_css() -> str:
+    """Build the eco-theme <style> payload once per process"""
+    return f"<style>{_ECO_CSS}</style>"
+
+@st.cache_resource(show_spinner=False)
+def _get_emissions_model() -> MLEmissionsPredictor:
+    """Shared ML emissions predictor, the same instance the carbon calculator uses"""
+    return _get_carbon_calculator().ml_predictor
+
+@st.cache_resource(show_spinner=False)
+def _get_route_model() -> MLRoutePredictor:
+    """Shared ML route predictor, constructed once per process"""
+    return MLRoutePredictor()
+
+@st.cache_resource(show_spinner=False)
+def _get_carbon_calculator() -> CarbonCalculator:
+    """Shared carbon calculator, constructed once per process"""
+    return CarbonCalculator()
+
+@st.cache_resource(show_spinner=False)
+def _get_geo_manager() -> GeographicDataManager:
+    """Shared geographic data manager, constructed once per process"""
+    return get_default_manager()
+
+@st.cache_resource(show_spinner=False)
+def _get_route_analyzer() -> RouteAnalyzer:
+    """Shared route analyzer, constructed once per process"""
+    return RouteAnalyzer()
+
+@st.cache_data(max_entries=4096)
+def _cached_distance(origin: str, destination: str) -> float:
+    """Memoized city-pair distance in km (pure function of the two names)"""
+    return _get_geo_manager().calculate_distance(origin, destination)
+
+@st.cache_data(max_entries=1024)
+def _cached_alternatives(origin: str, destination: str, modes: tuple,
+                         baseline_emissions: float) -> List[Dict[str, Any]]:
+    """Memoized alternative route generation keyed on the trip parameters"""
+    return _get_route_analyzer().generate_alternatives(
+        origin, destination, list(modes), baseline_emissions
+    )
+
+@st.cache_resource(show_spinner=False)
+def _warm_models() -> bool:
+    """Build the shared models once per process so the first interaction doesn't pay for it"""
+    _get_emissions_model()
+    _get_route_model()
+    _get_carbon_calculator()
+    _get_geo_manager()
+    _get_route_analyzer()
+    return True
+
+@st.cache_data
+def _get_emission_factors() -> Dict[str, float]:
+    """Base emission factors shown in the sidebar (static for the model's lifetime)"""
+    return _get_emissions_model().get_emission_factors_dict()
+
+@st.cache_data
+def _factors_md(factors: tuple) -> str:
+    """Render (mode, factor) pairs as a single markdown list"""
+    lines = []
+    for mode, factor in factors:
+        if mode != 'Hotel':
+            lines.append(f"- {mode}: {factor:.3f} kg CO₂e/km")
+        else:
+            lines.append(f"- {mode}: {factor:.1f} kg CO₂e/night")
+    return "\n".join(lines)
+
+def main():
+    """Main application entry point with comprehensive error handling and complete workflow"""
+    try:
+        # Configure Streamlit page with eco-friendly settings
+        configure_streamlit_app()
         
-        /* Button adjustments */
-        .stButton > button {
-            padding: 0.75rem 1.25rem;
-            font-size: 0.95rem;
-        }
+        # Preload shared models (no-op after the first run in this process);
+        # must follow set_page_config, which has to be the first Streamlit call
+        _warm_models()
         
-        /* Metric container */
-        .metric-container {
-            padding: 0.875rem;
-        }
+        # Apply comprehensive eco-themed styling
+        apply_eco_styling()
         
-        /* Chart container */
-        .chart-container {
-            padding: 0.875rem;
-        }
+        # Initialize session state with error handling
+        try:
+            SessionStateManager.initialize_session()
+        except Exception as e:
+            st.error("⚠️ Failed to initialize session. Please refresh the page.")
+            st.sidebar.error(f"Session Error: {str(e)}")
+            return
         
-        /* Tabs - stack vertically if needed */
-        .stTabs [data-baseweb="tab-list"] {
-            flex-direction: column;
-        }
+        # Render main application header with enhanced styling
+        render_enhanced_header()
         
-        .stTabs [data-baseweb="tab"] {
-            width: 100%;
-            margin-bottom: 0.5rem;
-        }
+        # Main application workflow
+        handle_main_workflow(SessionStateManager.snapshot())
         
-        /* Main container padding */
-        .main .block-container {
-            padding-left: 0.75rem;
-            padding-right: 0.75rem;
-            padding-top: 1.5rem;
-            padding-bottom: 1.5rem;
-        }
-    }
+        # Sidebar with status and configuration (re-read: the workflow may have stored results)
+        render_sidebar_content(SessionStateManager.snapshot())
+            
+    except _CONNECTION_CLOSED_ERRORS:
+        # WebSocket closed during a rerun - harmless, the client will reconnect
+        pass
+    except Exception as e:
+        # Catch-all error handler for other errors
+        handle_critical_error(e)
+
+@dataclass(frozen=True)
+class PageConfig:
+    """Keyword arguments for st.set_page_config"""
+    page_title: str
+    page_icon: str
+    layout: str
+    initial_sidebar_state: str
+    menu_items: Dict[str, str]
+
+@dataclass(frozen=True)
+class AppConfig:
+    """Deployment settings read from the environment once per process"""
+    page: PageConfig
+    theme_base: Optional[str]
+    max_upload_size: Optional[int]
+    is_production: bool
+
+@lru_cache(maxsize=1)
+def _load_config() -> AppConfig:
+    """Parse environment variables into an AppConfig (cached for the process lifetime)"""
+    max_upload_size = os.getenv('STREAMLIT_SERVER_MAX_UPLOAD_SIZE')
+    return AppConfig(
+        page=PageConfig(
+            page_title=os.getenv('STREAMLIT_PAGE_TITLE', ' EcoTrip Planner - Sustainable Travel Calculator'),
+            page_icon=os.getenv('STREAMLIT_PAGE_ICON', '🌱'),
+            layout=os.getenv('STREAMLIT_LAYOUT', 'wide'),
+            initial_sidebar_state=os.getenv('STREAMLIT_SIDEBAR_STATE', 'expanded'),
+            menu_items={
+                'Get Help': 'https://github.com/ecotrip-planner/help',
+                'Report a bug': 'https://github.com/ecotrip-planner/issues',
+                'About': "EcoTrip Planner helps you make sustainable travel choices by calculating carbon emissions and suggesting greener alternatives for travel within India."
+            }
+        ),
+        theme_base=os.getenv('STREAMLIT_THEME_BASE') or None,
+        max_upload_size=int(max_upload_size) if max_upload_size else None,
+        is_production=os.getenv('ENVIRONMENT', 'development').lower() == 'production'
+    )
+
+def configure_streamlit_app():
+    """Configure Streamlit application settings with deployment-ready options"""
+    cfg = _load_config()
     
-    /* Landscape orientation on mobile */
-    @media screen and (max-width: 768px) and (orientation: landscape) {
-        .main-header {
-            padding: 1rem 1.5rem;
-        }
-        
-        .main-header h1 {
-            font-size: 1.5rem;
-        }
-        
-        .main-header p {
-            font-size: 0.9rem;
-        }
-    }
+    st.set_page_config(**asdict(cfg.page))
     
-    /* Large screens (min-width: 1200px) - maintain readability */
-    @media screen and (min-width: 1200px) {
-        .main .block-container {
-            max-width: 1200px;
-            padding-left: 3rem;
-            padding-right: 3rem;
-        }
-    }
+    # Set additional configuration based on environment
+    if cfg.theme_base:
+        st._config.set_option('theme.base', cfg.theme_base)
     
-    /* Print styles */
-    @media print {
-        .main-header {
-            break-inside: avoid;
-        }
-        
-        .stForm {
-            break-inside: avoid;
-            page-break-inside: avoid;
-        }
-        
-        .chart-container {
-            break-inside: avoid;
-            page-break-inside: avoid;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Configure caching and performance settings
+    if cfg.max_upload_size is not None:
+        st._config.set_option('server.maxUploadSize', cfg.max_upload_size)
+    
+    # Development vs Production settings
+    if cfg.is_production:
+        # Production settings
+        st._config.set_option('global.developmentMode', False)
+        st._config.set_option('client.showErrorDetails', False)
+        st._config.set_option('browser.gatherUsageStats', False)
+    else:
+        # Development settings
+        st._config.set_option('global.developmentMode', True)
+        st._config.set_option('client.showErrorDetails', True)
+
+def apply_eco_styling():
+    """Apply comprehensive eco-themed styling with green colors and environmental design"""
+    st.markdown(_get_eco_css(), unsafe_allow_html=True)
 
 def render_enhanced_header():
     """Render enhanced application header with eco-friendly design"""
-    st.markdown("""
-    <div class="main-header">
-        <h1>🌱 EcoTrip Planner</h1>
-        <p>🌍 Make sustainable travel choices with carbon footprint insights for India 🇮🇳</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Add environmental impact notice
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        st.markdown("""
-        <div style="text-align: center; padding: 1rem; background-color: rgba(50, 205, 50, 0.1); 
-                    border-radius: 10px; margin-bottom: 2rem;">
-            <strong>🌿 Every sustainable choice counts!</strong><br>
-            <em>Calculate your carbon footprint • Compare alternatives • Travel responsibly</em>
-        </div>
-        """, unsafe_allow_html=True)
-
-def handle_main_workflow():
+        st.markdown(_IMPACT_NOTICE_HTML, unsafe_allow_html=True)
+
+def handle_main_workflow(snapshot: SessionSnapshot):
     """Handle the main application workflow: form → calculation → visualization → alternatives"""
     
     # Step 1: Trip Input Form
@@ -591,6 +702,8 @@ def handle_main_workflow():
             form_submitted = True
             # Trigger calculations if form data is complete and valid
             handle_carbon_calculation(form_data)
+            # The calculation stores fresh results, so the snapshot must be re-read
+            snapshot = SessionStateManager.snapshot()
             
     except Exception as e:
         UIComponents.handle_component_error("form", e, show_details=True)
@@ -598,8 +711,8 @@ def handle_main_workflow():
     
     # Step 2: Display Results if Available (always check, even if form just submitted)
     try:
-        emissions_data = SessionStateManager.get_emissions_data()
-        trip_data = SessionStateManager.get_trip_data()
+        emissions_data = snapshot.emissions
+        trip_data = snapshot.trip
         
         if emissions_data and 'total_co2e_kg' in emissions_data:
             # Always display emissions visualization with graphs
@@ -607,7 +720,7 @@ def handle_main_workflow():
             
             # Always generate and display alternative routes if trip data exists
             if trip_data and trip_data.get('origin_city') and trip_data.get('destination_city'):
-                handle_alternative_routes(trip_data, emissions_data)
+                handle_alternative_routes(trip_data, emissions_data, snapshot.alternatives)
             else:
                 st.warning("⚠️ Trip data incomplete. Please fill the form again.")
         elif not form_submitted:
@@ -615,23 +728,27 @@ def handle_main_workflow():
             st.info("💡 Please submit the form to calculate your carbon footprint")
             
     except Exception as e:
-        import traceback
         st.error(f"⚠️ Error displaying results: {str(e)}")
-        with st.expander("🔍 Error Details"):
-            st.code(traceback.format_exc())
+        render_error_details(e, "results")
         UIComponents.handle_component_error("visualization", e)
 
+def render_error_details(error: Exception, context: str):
+    """Render an error-details expander; the traceback is only formatted on request"""
+    with st.expander("🔍 Error Details"):
+        if st.checkbox("Show traceback", key=f"show_traceback_{context}"):
+            st.code("".join(traceback.format_exception(
+                type(error), error, error.__traceback__, limit=20
+            )))
+
 def handle_carbon_calculation(form_data: Dict[str, Any]):
     """Handle carbon footprint calculation with progress indicators"""
     try:
         # Show calculation progress
         with st.spinner("🧮 Calculating your carbon footprint..."):
             # Initialize components
-            carbon_calculator = CarbonCalculator()
-            geo_manager = GeographicDataManager()
+            carbon_calculator = _get_carbon_calculator()
             
             # Create trip data object
-            from components.models import TripData
             trip_data = TripData(
                 origin_city=form_data['origin_city'],
                 destination_city=form_data['destination_city'],
@@ -643,9 +760,10 @@ def handle_carbon_calculation(form_data: Dict[str, Any]):
             )
             
             # Calculate distance
-            distance_km = geo_manager.calculate_distance(
-                form_data['origin_city'], 
-                form_data['destination_city']
+            # City names are case-sensitive keys, so only whitespace is normalized
+            distance_km = _cached_distance(
+                form_data['origin_city'].strip(),
+                form_data['destination_city'].strip()
             )
             
             if distance_km <= 0:
@@ -694,7 +812,8 @@ def handle_carbon_calculation(form_data: Dict[str, Any]):
             st.error(f"⚠️ Calculation error: {error_msg}")
             UIComponents.handle_component_error("calculation", e)
 
-def handle_alternative_routes(trip_data: Dict[str, Any], emissions_data: Dict[str, Any]):
+def handle_alternative_routes(trip_data: Dict[str, Any], emissions_data: Dict[str, Any],
+                              alternatives: List[Dict[str, Any]]):
     """Handle alternative route generation and display"""
     try:
         origin = trip_data.get('origin_city', '')
@@ -705,7 +824,6 @@ def handle_alternative_routes(trip_data: Dict[str, Any], emissions_data: Dict[st
             return
         
         # Always generate alternatives if not already generated or if data changed
-        alternatives = SessionStateManager.get_alternatives_data()
         baseline_emissions = emissions_data.get('total_co2e_kg', 0)
         
         # Check if we need to regenerate alternatives
@@ -717,15 +835,16 @@ def handle_alternative_routes(trip_data: Dict[str, Any], emissions_data: Dict[st
         
         if should_regenerate:
             with st.spinner("🗺️ Finding greener alternative routes..."):
-                route_analyzer = RouteAnalyzer()
+                route_analyzer = _get_route_analyzer()
                 
                 # Generate alternatives for ALL transport modes (not just selected ones)
-                # This ensures we show greener options
-                alternatives = route_analyzer.generate_alternatives(
-                    origin,
-                    destination,
-                    trip_data.get('travel_modes', []),  # Use selected modes for baseline
-                    baseline_emissions
+                # This ensures we show greener options. Savings are recomputed against
+                # the exact baseline below, so the cache key can use a rounded one.
+                alternatives = _cached_alternatives(
+                    origin.strip(),
+                    destination.strip(),
+                    tuple(trip_data.get('travel_modes', [])),  # Use selected modes for baseline
+                    round(baseline_emissions, 1)
                 )
                 
                 if alternatives:
@@ -750,7 +869,6 @@ def handle_alternative_routes(trip_data: Dict[str, Any], emissions_data: Dict[st
                     # First convert dict alternatives to AlternativeRoute objects
                     alternative_objects = []
                     for alt in alternatives:
-                        from components.models import AlternativeRoute
                         alt_obj = AlternativeRoute(
                             transport_mode=alt.get('transport_mode', ''),
                             duration_hours=alt.get('duration_hours', 0.0),
@@ -770,21 +888,27 @@ def handle_alternative_routes(trip_data: Dict[str, Any], emissions_data: Dict[st
                         baseline_cost
                     )
                     
-                    # Convert back to dict format for storage
-                    alternatives = [alt.to_dict() for alt in alternatives_with_savings]
+                    # Columnar view of the alternatives: one contiguous array per field
+                    alternatives_df = pd.DataFrame.from_records(
+                        [alt.to_dict() for alt in alternatives_with_savings]
+                    )
                     
                     # Ensure alternatives are sorted by emissions (greenest first)
-                    alternatives = sorted(alternatives, key=lambda x: x.get('co2e_emissions_kg', float('inf')))
+                    alternatives_df = alternatives_df.sort_values('co2e_emissions_kg', kind='stable')
+                    greener_count = int((alternatives_df['co2e_emissions_kg'] < baseline_emissions).sum())
+                    
+                    # Convert back to dict format for storage
+                    alternatives = alternatives_df.to_dict('records')
                     
                     SessionStateManager.store_alternatives_data(alternatives)
                     st.session_state['alternatives_generated'] = True
-                    st.success(f"✅ Found {len(alternatives)} alternative route(s)!")
+                    st.success(f"✅ Found {len(alternatives)} alternative route(s), "
+                               f"{greener_count} greener than your trip!")
                 else:
                     st.warning("⚠️ No alternative routes available for this route.")
                     return
         
-        # Display alternatives if available
-        alternatives = SessionStateManager.get_alternatives_data()
+        # Display alternatives if available (either the stored ones or those just generated)
         if alternatives and len(alternatives) > 0:
             st.markdown("---")
             VisualizationComponents.render_alternatives_dashboard(
@@ -797,16 +921,14 @@ def handle_alternative_routes(trip_data: Dict[str, Any], emissions_data: Dict[st
             
     except Exception as e:
         st.error(f"⚠️ Error generating alternatives: {str(e)}")
-        import traceback
-        with st.expander("🔍 Error Details"):
-            st.code(traceback.format_exc())
+        render_error_details(e, "alternatives")
         UIComponents.handle_component_error("alternatives", e)
 
-def render_sidebar_content():
+def render_sidebar_content(snapshot: SessionSnapshot):
     """Render comprehensive sidebar with status, configuration, and help"""
     try:
         # Session status
-        display_session_status()
+        display_session_status(snapshot)
         
         # Environment/API status
         display_environment_status()
@@ -943,27 +1065,25 @@ def handle_critical_error(error: Exception):
     except Exception:
         st.error("Minimal interface also unavailable. Please refresh the page.")
 
-def display_session_status():
+def display_session_status(snapshot: SessionSnapshot):
     """Display current session data status in sidebar with enhanced information"""
     try:
         st.sidebar.header("📊 Session Status")
         
-        session_summary = SessionStateManager.get_session_summary()
+        session_summary = snapshot.summary
         
         # Trip data status
         if session_summary['has_trip_data']:
             st.sidebar.success("✅ Trip data stored")
-            trip_data = SessionStateManager.get_trip_data()
+            trip_data = snapshot.trip
             if trip_data.get('origin_city') and trip_data.get('destination_city'):
-                st.sidebar.info(f"🗺️ {trip_data['origin_city']} → {trip_data['destination_city']}")
-                
-                # Show additional trip details
+                # Route plus additional trip details in a single element
+                details = [f"🗺️ {trip_data['origin_city']} → {trip_data['destination_city']}"]
                 if trip_data.get('travel_modes'):
-                    modes_str = ", ".join(trip_data['travel_modes'])
-                    st.sidebar.text(f"🚗 Modes: {modes_str}")
-                
+                    details.append(f"🚗 Modes: {', '.join(trip_data['travel_modes'])}")
                 if trip_data.get('num_travelers'):
-                    st.sidebar.text(f"👥 Travelers: {trip_data['num_travelers']}")
+                    details.append(f"👥 Travelers: {trip_data['num_travelers']}")
+                st.sidebar.info("  \n".join(details))
         else:
             st.sidebar.info("📝 No trip data yet")
         
@@ -971,7 +1091,7 @@ def display_session_status():
         if session_summary['has_emissions_data']:
             st.sidebar.success("✅ Emissions calculated")
             
-            emissions_data = SessionStateManager.get_emissions_data()
+            emissions_data = snapshot.emissions
             if emissions_data:
                 total_emissions = emissions_data.get('total_co2e_kg', 0)
                 st.sidebar.metric(
@@ -987,7 +1107,7 @@ def display_session_status():
             st.sidebar.info("🧮 No emissions data yet")
         
         # Alternatives status
-        alternatives = SessionStateManager.get_alternatives_data()
+        alternatives = snapshot.alternatives
         if alternatives:
             st.sidebar.success(f"✅ {len(alternatives)} alternatives found")
         elif session_summary['has_emissions_data']:
@@ -1007,11 +1127,8 @@ def display_environment_status():
         
         # Show ML model information
         try:
-            from components.ml_emissions_model import MLEmissionsPredictor
-            from components.ml_route_predictor import MLRoutePredictor
-            
-            emissions_model = MLEmissionsPredictor()
-            route_model = MLRoutePredictor()
+            emissions_model = _get_emissions_model()
+            route_model = _get_route_model()
             
             model_info = emissions_model.get_model_info()
             
@@ -1022,12 +1139,8 @@ def display_environment_status():
             
             # Show emission factors
             with st.sidebar.expander("📈 Emission Factors"):
-                factors = emissions_model.get_emission_factors_dict()
-                for mode, factor in factors.items():
-                    if mode != 'Hotel':
-                        st.sidebar.text(f"{mode}: {factor:.3f} kg CO₂e/km")
-                    else:
-                        st.sidebar.text(f"{mode}: {factor:.1f} kg CO₂e/night")
+                factors = _get_emission_factors()
+                st.markdown(_factors_md(tuple(factors.items())))
             
             st.sidebar.info("💡 Using ML-based predictions (no API required)")
             
@@ -1058,11 +1171,8 @@ def display_environment_status():
 def test_ml_models():
     """Test ML model predictions with sample data"""
     try:
-        from components.ml_emissions_model import MLEmissionsPredictor
-        from components.ml_route_predictor import MLRoutePredictor
-        
-        emissions_model = MLEmissionsPredictor()
-        route_model = MLRoutePredictor()
+        emissions_model = _get_emissions_model()
+        route_model = _get_route_model()
         
         with st.spinner("Testing ML Models..."):
             # Test emissions prediction
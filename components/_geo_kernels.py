@@ -0,0 +1,39 @@
+"""
+Distance kernels for EcoTrip Planner
+
+Great-circle (haversine) distances on a spherical Earth. For city-to-city
+trips within India these stay within about 0.5% of the WGS-84 geodesic,
+at a small fraction of geopy's iterative solver cost.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+
+# Mean Earth radius (IUGG) in kilometers
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in kilometers between two points given in radians"""
+    sin_dlat = math.sin((lat2 - lat1) * 0.5)
+    sin_dlon = math.sin((lon2 - lon1) * 0.5)
+    a = sin_dlat * sin_dlat + math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon
+    return 2.0 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
+
+
+def haversine_km_array(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray,
+                       cos_lat1: Optional[np.ndarray] = None, cos_lat2: Optional[np.ndarray] = None) -> np.ndarray:
+    """Element-wise great-circle distances in kilometers for arrays of points given in radians.
+    
+    Precomputed cosines of the latitudes may be passed to skip recomputing them.
+    """
+    if cos_lat1 is None:
+        cos_lat1 = np.cos(lat1)
+    if cos_lat2 is None:
+        cos_lat2 = np.cos(lat2)
+    sin_dlat = np.sin((lat2 - lat1) * 0.5)
+    sin_dlon = np.sin((lon2 - lon1) * 0.5)
+    a = sin_dlat * sin_dlat + cos_lat1 * cos_lat2 * sin_dlon * sin_dlon
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(1.0, a)))
@@ -7,32 +7,231 @@ including error handling, retry logic, rate limiting, and fallback mechanisms.
 
 import os
 import requests
-from typing import Dict, Any, Optional, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, Dict, Any, Optional, List, Union
 import time
 import logging
-from datetime import datetime, timedelta
+import threading
+from types import MappingProxyType
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from .geographic_data import get_default_manager
+
+# Optional faster JSON decoder for the large Directions payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Map transport modes to Climatiq activity IDs
+_ACTIVITY_MAPPING = MappingProxyType({
+    'Flight': 'passenger_flight-route_type_domestic-aircraft_type_na-distance_na-class_na-rf_na',
+    'Train': 'passenger_train-route_type_national_rail-fuel_source_na',
+    'Car': 'passenger_vehicle-vehicle_type_car-fuel_source_petrol-engine_size_na-vehicle_age_na-vehicle_weight_na',
+    'Bus': 'passenger_vehicle-vehicle_type_bus-fuel_source_diesel-engine_size_na-vehicle_age_na-vehicle_weight_na',
+    'Hotel': 'accommodation-type_hotel'
+})
+
+# Map our internal modes to Google Maps travel modes
+_MODE_MAPPING = MappingProxyType({
+    'Car': 'driving',
+    'Bus': 'transit',
+    'Train': 'transit',
+    'Flight': None  # Flights not supported by Directions API
+})
+
+# Shared read-only default for chained .get() lookups into nested API JSON
+_EMPTY_MAPPING = MappingProxyType({})
+
+# Internal modes whose Directions results may include transit legs
+_TRANSIT_MODES = frozenset(('Bus', 'Train'))
+
+# Fixed part of every Climatiq emission factor selector
+_EMISSION_FACTOR_TEMPLATE = MappingProxyType({
+    'source': 'DEFRA',
+    'region': 'IN',  # India
+    'year': 2023
+})
+
+# Reciprocal average speeds (hours per km) for fallback duration estimates
+_INV_SPEED_KMH = MappingProxyType({
+    'Car': 1 / 60.0,     # 60 km/h average including stops
+    'Bus': 1 / 45.0,     # 45 km/h average including stops
+    'Train': 1 / 80.0,   # 80 km/h average for Indian trains
+    'Flight': 1 / 500.0  # 500 km/h average including airport time
+})
+_DEFAULT_INV_SPEED_KMH = 1 / 50.0
+
+# Route returned when even the fallback estimate fails; copied with fresh lists per use
+_DEFAULT_FALLBACK_ROUTE = MappingProxyType({
+    'distance_km': 500.0,
+    'duration_hours': 8.0,
+    'polyline': '',
+    'copyrights': 'Default route estimation',
+    'is_fallback': True
+})
+
+
+def _build_estimate_payload(activity_id: str, distance_km: Optional[float] = None) -> Dict[str, Any]:
+    """Build a Climatiq estimate request body for an activity and optional distance"""
+    emission_factor = _EMISSION_FACTOR_TEMPLATE.copy()
+    emission_factor['activity_id'] = activity_id
+    request_data = {'emission_factor': emission_factor}
+    
+    if distance_km:
+        request_data['parameters'] = {
+            'distance': distance_km,
+            'distance_unit': 'km'
+        }
+    
+    return request_data
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@lru_cache(maxsize=2048)
+def _fallback_distance_km(origin: str, destination: str) -> Optional[float]:
+    """Geodesic distance between two known cities, or None if either is unknown"""
+    return get_default_manager().calculate_geodesic_distance(origin, destination)
+
+
+class RateLimited(Exception):
+    """Raised when a request is skipped because the client-side rate limit is exhausted"""
+
+
+# HTTP statuses that end a request without further retries, with the reason logged
+_CLIMATIQ_STATUS_ERRORS = {
+    401: "Authentication failed. Please check your API key.",
+    403: "Access forbidden. Please check your API permissions.",
+    404: "API endpoint not found.",
+    429: "Rate limit exceeded (429)."
+}
+
+_GOOGLE_MAPS_STATUS_ERRORS = {
+    401: "Authentication failed. Please check your Google Maps API key.",
+    403: "Access forbidden. Please check your Google Maps API permissions and billing.",
+    429: "Rate limit exceeded (429)."
+}
+
+# Google Maps error statuses reported in the response body
+_GOOGLE_MAPS_API_STATUS_ERRORS = {
+    'REQUEST_DENIED': "Request denied. Please check your API key and permissions.",
+    'OVER_QUERY_LIMIT': "Query limit exceeded. Please check your API quota.",
+    'INVALID_REQUEST': "Invalid request parameters."
+}
+
+class _TransportRetry(Retry):
+    """urllib3 Retry that caps Retry-After waits and reports every retry it makes"""
+    
+    # Longest server-requested wait honoured before retrying, in seconds
+    RETRY_AFTER_MAX = 10.0
+    
+    def __init__(self, *args, on_retry: Optional[Callable[[], None]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_retry = on_retry
+    
+    def new(self, **kw) -> 'Retry':
+        kw.setdefault('on_retry', self.on_retry)
+        return super().new(**kw)
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.RETRY_AFTER_MAX)
+    
+    def increment(self, *args, **kwargs) -> 'Retry':
+        # Raises MaxRetryError once exhausted, so the callback only sees real retries
+        retry = super().increment(*args, **kwargs)
+        if self.on_retry is not None:
+            self.on_retry()
+        return retry
+
+
+# Transport-level retries for throttling and server errors; honours Retry-After
+# up to RETRY_AFTER_MAX. Connection errors and timeouts are retried by
+# _send_with_retries instead.
+_TRANSPORT_RETRY = _TransportRetry(
+    total=2,
+    connect=0,
+    read=0,
+    status=2,
+    backoff_factor=1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'POST']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+
+def _retry_backoff(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying after a request exception"""
+    # Exponential backoff for network-level failures, a short pause otherwise
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return 2 ** attempt
+    return 1.0
 
 
 class APIClientManager:
     """Manages external API communications with error handling and retry logic"""
     
+    # Maximum number of estimates Climatiq accepts in one batch request
+    CLIMATIQ_BATCH_SIZE = 100
+    
     def __init__(self):
         self.climatiq_api_key = os.getenv('CLIMATIQ_API_KEY')
         self.google_maps_api_key = os.getenv('GOOGLE_MAPS_API_KEY')
         self.climatiq_base_url = "https://beta3.api.climatiq.io"
         self.google_maps_base_url = "https://maps.googleapis.com/maps/api"
         
-        # Rate limiting tracking
-        self._last_climatiq_request = None
-        self._last_google_maps_request = None
-        self._climatiq_request_count = 0
-        self._google_maps_request_count = 0
-        self._rate_limit_window_start = datetime.now()
+        # Full request URLs memoized per endpoint
+        self._climatiq_urls: Dict[str, str] = {}
+        self._google_maps_urls: Dict[str, str] = {}
+        
+        # Rate limiting tracking: monotonic timestamps of requests in the last 60 seconds
+        self._request_times = {
+            'climatiq': deque(),
+            'google_maps': deque()
+        }
+        # Guards the rate-limit bookkeeping so lookups can run from worker threads
+        self._rate_limit_lock = threading.Lock()
         
         # Rate limits (requests per minute)
         self.climatiq_rate_limit = 60
         self.google_maps_rate_limit = 100
         
+        # Pooled keep-alive connections shared by all requests from this client;
+        # each API gets its own adapter so transport retries count against its budget
+        self._session = requests.Session()
+        for api_name, base_url in (('climatiq', self.climatiq_base_url),
+                                   ('google_maps', self.google_maps_base_url)):
+            retry = _TRANSPORT_RETRY.new(on_retry=partial(self._update_rate_limit_tracking, api_name))
+            self._session.mount(base_url, HTTPAdapter(pool_connections=2, pool_maxsize=32, max_retries=retry))
+        
+        # Climatiq emission factors keyed by (mode, distance bucket) -> (expires_at, factor)
+        self._emission_cache: Dict[tuple, tuple] = {}
+        self._emission_cache_lock = threading.Lock()
+        self.emission_cache_ttl = 3600.0  # seconds
+        self.emission_cache_maxsize = 512
+        
+        # get_api_status result cache and last successful Climatiq call (monotonic seconds)
+        self.api_status_ttl = 300.0
+        self._api_status_cache: Optional[tuple] = None
+        self._last_climatiq_success: Optional[float] = None
+        
+        # Processed directions keyed by (mode, overview polylines of every route)
+        self._directions_cache: "OrderedDict[tuple, List[Dict[str, Any]]]" = OrderedDict()
+        self._directions_cache_lock = threading.Lock()
+        self.directions_cache_maxsize = 256
+        
         # Static emission factors as fallback
         self.static_emission_factors = {
             'Flight': 0.255,  # kg CO2e per km per person
@@ -42,245 +241,136 @@ class APIClientManager:
             'Hotel': 30.0     # kg CO2e per night per person
         }
     
-    def query_climatiq_api(self, endpoint: str, data: Dict[str, Any], max_retries: int = 3) -> Optional[Dict[str, Any]]:
-        """Query Climatiq API with authentication, retry logic, and comprehensive error handling"""
+    def query_climatiq_api(self, endpoint: str, data: Union[Dict[str, Any], List[Dict[str, Any]]], max_retries: int = 3) -> Optional[Dict[str, Any]]:
+        """Query Climatiq API with authentication, retry logic, and comprehensive error handling
+        
+        Returns None when the key is missing or the request fails; raises
+        RateLimited when the client-side rate limit is exhausted.
+        """
         if not self.climatiq_api_key:
             return None
         
         # Check rate limits before making request
-        if not self._check_rate_limit('climatiq'):
-            return None
+        if not self._check_rate_limit('climatiq', reserve=True):
+            raise RateLimited(f"Climatiq rate limit of {self.climatiq_rate_limit} requests/minute reached")
         
         headers = {
             'Authorization': f'Bearer {self.climatiq_api_key}',
             'Content-Type': 'application/json'
         }
         
-        last_error = None
+        api_response = self._send_with_retries(
+            'climatiq', self._session.post, self._endpoint_url(self._climatiq_urls, self.climatiq_base_url, endpoint),
+            max_retries, _CLIMATIQ_STATUS_ERRORS, json=data, headers=headers
+        )
+        if api_response is not None:
+            self._last_climatiq_success = time.monotonic()
         
-        for attempt in range(max_retries):
-            try:
-                # Apply rate limiting delay
-                self._apply_rate_limit_delay('climatiq')
-                
-                response = requests.post(
-                    f"{self.climatiq_base_url}/{endpoint}",
-                    json=data,
-                    headers=headers,
-                    timeout=10
-                )
-                
-                # Update rate limiting tracking
-                self._update_rate_limit_tracking('climatiq')
-                
-                # Handle rate limit responses
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_after)
-                        continue
-                    else:
-                        last_error = f"Rate limit exceeded (429). Retry after {retry_after} seconds."
-                        return None
-                
-                # Handle authentication errors
-                if response.status_code == 401:
-                    last_error = "Authentication failed. Please check your API key."
-                    return None
-                
-                # Handle forbidden access
-                if response.status_code == 403:
-                    last_error = "Access forbidden. Please check your API permissions."
-                    return None
-                
-                # Handle not found errors
-                if response.status_code == 404:
-                    last_error = f"API endpoint not found: {endpoint}"
-                    return None
-                
-                # Handle server errors
-                if response.status_code >= 500:
-                    last_error = f"Server error ({response.status_code}). Service may be temporarily unavailable."
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    else:
-                        return None
-                
-                response.raise_for_status()
-                return response.json()
-                
-            except requests.exceptions.Timeout:
-                last_error = f"Request timeout (attempt {attempt + 1}/{max_retries})"
-                if attempt < max_retries - 1:
-                    # Exponential backoff for timeouts
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    return None
-                    
-            except requests.exceptions.ConnectionError:
-                last_error = f"Connection error (attempt {attempt + 1}/{max_retries})"
-                if attempt < max_retries - 1:
-                    # Exponential backoff for connection errors
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    return None
-            
-            except requests.exceptions.HTTPError as e:
-                last_error = f"HTTP error: {e}"
-                if attempt < max_retries - 1:
-                    time.sleep(1)
-                    continue
-                else:
-                    return None
-                    
-            except requests.RequestException as e:
-                last_error = f"Request error: {e}"
-                if attempt < max_retries - 1:
-                    time.sleep(1)
-                    continue
-                else:
-                    return None
-            
-            except Exception as e:
-                last_error = f"Unexpected error: {e}"
-                return None
-        
-        # Log the last error for debugging
-        if last_error:
-            logging.warning(f"Climatiq API failed after {max_retries} attempts: {last_error}")
-        
-        return None
+        return api_response
     
     def query_google_maps_api(self, endpoint: str, params: Dict[str, Any], max_retries: int = 3) -> Optional[Dict[str, Any]]:
-        """Query Google Maps API with retry logic and comprehensive error handling"""
+        """Query Google Maps API with retry logic and comprehensive error handling
+        
+        Returns None when the key is missing or the request fails; raises
+        RateLimited when the client-side rate limit is exhausted.
+        """
         if not self.google_maps_api_key:
             return None
         
         # Check rate limits before making request
-        if not self._check_rate_limit('google_maps'):
+        if not self._check_rate_limit('google_maps', reserve=True):
+            raise RateLimited(f"Google Maps rate limit of {self.google_maps_rate_limit} requests/minute reached")
+        
+        # Add the key to a copy so the caller's params are left untouched
+        request_params = dict(params, key=self.google_maps_api_key)
+        
+        api_response = self._send_with_retries(
+            'google_maps', self._session.get, self._endpoint_url(self._google_maps_urls, self.google_maps_base_url, endpoint),
+            max_retries, _GOOGLE_MAPS_STATUS_ERRORS, params=request_params
+        )
+        if api_response is None:
             return None
         
-        params['key'] = self.google_maps_api_key
+        # Check for Google Maps specific error statuses (ZERO_RESULTS is not an error)
+        status = api_response.get('status')
+        if status is not None and status not in ('OK', 'ZERO_RESULTS'):
+            logging.warning(f"Google Maps API failed: {_GOOGLE_MAPS_API_STATUS_ERRORS.get(status, f'API returned status: {status}')}")
+            return None
+        
+        return api_response
+    
+    @staticmethod
+    def _endpoint_url(urls: Dict[str, str], base_url: str, endpoint: str) -> str:
+        """Return the full URL for an endpoint, building it once"""
+        url = urls.get(endpoint)
+        if url is None:
+            url = urls.setdefault(endpoint, f"{base_url}/{endpoint}")
+        return url
+    
+    def _send_with_retries(self, api_name: str, send, url: str, max_retries: int,
+                           status_errors: Dict[int, str], **kwargs) -> Optional[Dict[str, Any]]:
+        """Send a request and return its JSON body, retrying transient network errors.
+        
+        HTTP 429/5xx responses are retried (with a capped Retry-After wait) by
+        the session's transport adapter, which counts each retry against the
+        rate limit, so a response that still carries one of those statuses
+        here is final.
+        """
         last_error = None
         
         for attempt in range(max_retries):
             try:
-                # Apply rate limiting delay
-                self._apply_rate_limit_delay('google_maps')
-                
-                response = requests.get(
-                    f"{self.google_maps_base_url}/{endpoint}",
-                    params=params,
-                    timeout=10
-                )
-                
-                # Update rate limiting tracking
-                self._update_rate_limit_tracking('google_maps')
+                # The first attempt was counted when the caller reserved its slot
+                if attempt > 0:
+                    self._update_rate_limit_tracking(api_name)
                 
-                # Handle rate limit responses
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_after)
-                        continue
-                    else:
-                        last_error = f"Rate limit exceeded (429). Retry after {retry_after} seconds."
-                        return None
+                response = send(url, timeout=10, **kwargs)
                 
-                # Handle authentication errors
-                if response.status_code == 401:
-                    last_error = "Authentication failed. Please check your Google Maps API key."
-                    return None
-                
-                # Handle forbidden access
-                if response.status_code == 403:
-                    last_error = "Access forbidden. Please check your Google Maps API permissions and billing."
-                    return None
-                
-                # Handle server errors
-                if response.status_code >= 500:
-                    last_error = f"Server error ({response.status_code}). Google Maps service may be temporarily unavailable."
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    else:
-                        return None
+                status_code = response.status_code
+                if status_code in status_errors or status_code >= 500:
+                    last_error = status_errors.get(status_code, f"Server error ({status_code}). Service may be temporarily unavailable.")
+                    break
                 
                 response.raise_for_status()
-                api_response = response.json()
-                
-                # Check for Google Maps specific error statuses
-                if 'status' in api_response:
-                    status = api_response.get('status')
-                    if status == 'REQUEST_DENIED':
-                        last_error = "Request denied. Please check your API key and permissions."
-                        return None
-                    elif status == 'OVER_QUERY_LIMIT':
-                        last_error = "Query limit exceeded. Please check your API quota."
-                        return None
-                    elif status == 'INVALID_REQUEST':
-                        last_error = "Invalid request parameters."
-                        return None
-                    elif status == 'ZERO_RESULTS':
-                        # This is not an error, just no results found
-                        return api_response
-                    elif status != 'OK':
-                        last_error = f"API returned status: {status}"
-                        return None
-                
-                return api_response
-                
-            except requests.exceptions.Timeout:
-                last_error = f"Request timeout (attempt {attempt + 1}/{max_retries})"
-                if attempt < max_retries - 1:
-                    # Exponential backoff for timeouts
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    return None
-                    
-            except requests.exceptions.ConnectionError:
-                last_error = f"Connection error (attempt {attempt + 1}/{max_retries})"
-                if attempt < max_retries - 1:
-                    # Exponential backoff for connection errors
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    return None
+                return _decode_json(response)
             
-            except requests.exceptions.HTTPError as e:
-                last_error = f"HTTP error: {e}"
-                if attempt < max_retries - 1:
-                    time.sleep(1)
-                    continue
-                else:
-                    return None
-                    
             except requests.RequestException as e:
-                last_error = f"Request error: {e}"
+                last_error = f"{type(e).__name__} (attempt {attempt + 1}/{max_retries}): {e}"
                 if attempt < max_retries - 1:
-                    time.sleep(1)
-                    continue
-                else:
-                    return None
+                    time.sleep(_retry_backoff(e, attempt))
             
             except Exception as e:
                 last_error = f"Unexpected error: {e}"
-                return None
+                break
         
         # Log the last error for debugging
         if last_error:
-            logging.warning(f"Google Maps API failed after {max_retries} attempts: {last_error}")
+            logging.warning(f"{api_name} API request failed: {last_error}")
         
         return None
     
+    def close(self) -> None:
+        """Release pooled HTTP connections"""
+        self._session.close()
+    
     def get_emission_factor_with_fallback(self, transport_mode: str, distance_km: float = None) -> float:
         """Get emission factor from API with fallback to static data"""
-        # Try to get from Climatiq API first
-        api_factor = self._get_climatiq_emission_factor(transport_mode, distance_km)
+        # Without a key or a Climatiq activity for this mode the API can't help
+        if not self.climatiq_api_key or transport_mode not in _ACTIVITY_MAPPING:
+            return self.static_emission_factors.get(transport_mode, 0.0)
+        
+        # Serve repeated lookups from the TTL cache, then try the Climatiq API
+        cache_key = (transport_mode, round(distance_km, 1) if distance_km else None)
+        api_factor = self._get_cached_emission_factor(cache_key)
+        
+        if api_factor is None:
+            try:
+                api_factor = self._get_climatiq_emission_factor(transport_mode, distance_km)
+            except RateLimited as e:
+                logging.info(f"Climatiq request skipped (rate limited), using static factor for {transport_mode}: {e}")
+                return self.static_emission_factors.get(transport_mode, 0.0)
+            if api_factor is not None:
+                self._store_cached_emission_factor(cache_key, api_factor)
         
         if api_factor is not None:
             return api_factor
@@ -288,87 +378,136 @@ class APIClientManager:
         # Fallback to static emission factors
         return self.static_emission_factors.get(transport_mode, 0.0)
     
-    def _get_climatiq_emission_factor(self, transport_mode: str, distance_km: float = None) -> Optional[float]:
-        """Query Climatiq API for emission factors"""
-        # Map transport modes to Climatiq activity IDs
-        activity_mapping = {
-            'Flight': 'passenger_flight-route_type_domestic-aircraft_type_na-distance_na-class_na-rf_na',
-            'Train': 'passenger_train-route_type_national_rail-fuel_source_na',
-            'Car': 'passenger_vehicle-vehicle_type_car-fuel_source_petrol-engine_size_na-vehicle_age_na-vehicle_weight_na',
-            'Bus': 'passenger_vehicle-vehicle_type_bus-fuel_source_diesel-engine_size_na-vehicle_age_na-vehicle_weight_na',
-            'Hotel': 'accommodation-type_hotel'
-        }
+    def _get_cached_emission_factor(self, cache_key: tuple) -> Optional[float]:
+        """Return a cached Climatiq emission factor if present and not expired"""
+        with self._emission_cache_lock:
+            entry = self._emission_cache.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, factor = entry
+            if time.monotonic() >= expires_at:
+                del self._emission_cache[cache_key]
+                return None
+            return factor
+    
+    def _store_cached_emission_factor(self, cache_key: tuple, factor: float) -> None:
+        """Cache a Climatiq emission factor, evicting expired then oldest entries when full"""
+        with self._emission_cache_lock:
+            now = time.monotonic()
+            if cache_key not in self._emission_cache and len(self._emission_cache) >= self.emission_cache_maxsize:
+                for key in [k for k, (expires_at, _) in self._emission_cache.items() if expires_at <= now]:
+                    del self._emission_cache[key]
+                if len(self._emission_cache) >= self.emission_cache_maxsize:
+                    del self._emission_cache[next(iter(self._emission_cache))]
+            self._emission_cache[cache_key] = (now + self.emission_cache_ttl, factor)
+    
+    def clear_emission_cache(self) -> None:
+        """Drop all cached Climatiq emission factors"""
+        with self._emission_cache_lock:
+            self._emission_cache.clear()
+    
+    def get_emission_factors_batch(self, lookups: List[tuple]) -> Dict[tuple, float]:
+        """Get emission factors for many (transport_mode, distance_km) pairs with one batch request per chunk"""
+        if not self.climatiq_api_key:
+            return {
+                (transport_mode, distance_km): self.static_emission_factors.get(transport_mode, 0.0)
+                for transport_mode, distance_km in lookups
+            }
+        
+        results = {}
+        pending = {}
+        
+        # Serve what we can from the cache and build batch payloads for the rest
+        for transport_mode, distance_km in dict.fromkeys(lookups):
+            cache_key = (transport_mode, round(distance_km, 1) if distance_km else None)
+            cached_factor = self._get_cached_emission_factor(cache_key)
+            if cached_factor is not None:
+                results[(transport_mode, distance_km)] = cached_factor
+                continue
+            
+            request_data = self._build_estimate_request(transport_mode, distance_km)
+            if request_data is None:
+                results[(transport_mode, distance_km)] = self.static_emission_factors.get(transport_mode, 0.0)
+            else:
+                pending[(transport_mode, distance_km)] = (cache_key, request_data)
         
-        activity_id = activity_mapping.get(transport_mode)
+        pending_items = list(pending.items())
+        for start in range(0, len(pending_items), self.CLIMATIQ_BATCH_SIZE):
+            chunk = pending_items[start:start + self.CLIMATIQ_BATCH_SIZE]
+            
+            try:
+                response = self.query_climatiq_api('estimate/batch', [request_data for _, (_, request_data) in chunk])
+            except Exception:
+                response = None
+            
+            batch_results = response.get('results', []) if isinstance(response, dict) else []
+            
+            # Responses come back in request order; fall back per item on errors or short replies
+            for index, (lookup, (cache_key, _)) in enumerate(chunk):
+                item = batch_results[index] if index < len(batch_results) else None
+                if isinstance(item, dict) and 'co2e' in item:
+                    results[lookup] = item['co2e']
+                    self._store_cached_emission_factor(cache_key, item['co2e'])
+                else:
+                    results[lookup] = self.static_emission_factors.get(lookup[0], 0.0)
+        
+        return results
+    
+    def _build_estimate_request(self, transport_mode: str, distance_km: float = None) -> Optional[Dict[str, Any]]:
+        """Build a Climatiq estimate request body, or None for unsupported modes"""
+        activity_id = _ACTIVITY_MAPPING.get(transport_mode)
         if not activity_id:
             return None
         
-        # Prepare API request data
-        request_data = {
-            'emission_factor': {
-                'activity_id': activity_id,
-                'source': 'DEFRA',
-                'region': 'IN',  # India
-                'year': 2023
-            }
-        }
-        
-        # Add distance for transport modes if provided
-        if distance_km and transport_mode != 'Hotel':
-            request_data['parameters'] = {
-                'distance': distance_km,
-                'distance_unit': 'km'
-            }
+        # Distance only applies to transport modes
+        return _build_estimate_payload(activity_id, distance_km if transport_mode != 'Hotel' else None)
+    
+    def _get_climatiq_emission_factor(self, transport_mode: str, distance_km: float = None) -> Optional[float]:
+        """Query Climatiq API for emission factors"""
+        request_data = self._build_estimate_request(transport_mode, distance_km)
+        if request_data is None:
+            return None
         
         try:
             response = self.query_climatiq_api('estimate', request_data)
             if response and 'co2e' in response:
                 return response['co2e']
+        except RateLimited:
+            # Skipped rather than failed; let the caller decide how to report it
+            raise
         except Exception:
             pass
         
         return None
     
-    def _check_rate_limit(self, api_name: str) -> bool:
-        """Check if we're within rate limits for the specified API"""
-        now = datetime.now()
-        
-        # Reset counters if window has passed
-        if now - self._rate_limit_window_start > timedelta(minutes=1):
-            self._climatiq_request_count = 0
-            self._google_maps_request_count = 0
-            self._rate_limit_window_start = now
-        
-        if api_name == 'climatiq':
-            return self._climatiq_request_count < self.climatiq_rate_limit
-        elif api_name == 'google_maps':
-            return self._google_maps_request_count < self.google_maps_rate_limit
-        
-        return False
-    
-    def _apply_rate_limit_delay(self, api_name: str) -> None:
-        """Apply appropriate delay between requests"""
-        now = datetime.now()
-        
-        if api_name == 'climatiq' and self._last_climatiq_request:
-            elapsed = (now - self._last_climatiq_request).total_seconds()
-            if elapsed < 1.0:  # Minimum 1 second between requests
-                time.sleep(1.0 - elapsed)
-        elif api_name == 'google_maps' and self._last_google_maps_request:
-            elapsed = (now - self._last_google_maps_request).total_seconds()
-            if elapsed < 0.6:  # Minimum 0.6 seconds between requests
-                time.sleep(0.6 - elapsed)
+    def _check_rate_limit(self, api_name: str, reserve: bool = False) -> bool:
+        """Check if we're within rate limits for the specified API.
+        
+        With reserve=True the check and the recording of the request happen
+        under one lock, so concurrent callers cannot all pass the last slot.
+        """
+        limits = {'climatiq': self.climatiq_rate_limit, 'google_maps': self.google_maps_rate_limit}
+        if api_name not in limits:
+            return False
+        
+        with self._rate_limit_lock:
+            # Sliding window: drop requests older than 60 seconds
+            request_times = self._request_times[api_name]
+            window_start = time.monotonic() - 60.0
+            while request_times and request_times[0] < window_start:
+                request_times.popleft()
+            
+            allowed = len(request_times) < limits[api_name]
+            if allowed and reserve:
+                request_times.append(time.monotonic())
+            return allowed
     
     def _update_rate_limit_tracking(self, api_name: str) -> None:
-        """Update rate limiting tracking after successful request"""
-        now = datetime.now()
-        
-        if api_name == 'climatiq':
-            self._last_climatiq_request = now
-            self._climatiq_request_count += 1
-        elif api_name == 'google_maps':
-            self._last_google_maps_request = now
-            self._google_maps_request_count += 1
+        """Record a request against the API's sliding window"""
+        request_times = self._request_times.get(api_name)
+        if request_times is not None:
+            with self._rate_limit_lock:
+                request_times.append(time.monotonic())
     
     def handle_api_errors(self, response: Optional[Dict[str, Any]], api_name: str = "Unknown") -> Dict[str, Any]:
         """Enhanced API error handling with detailed error information"""
@@ -453,7 +592,17 @@ class APIClientManager:
         return error_info  # No error detected
     
     def get_api_status(self) -> Dict[str, Dict[str, Any]]:
-        """Get current status of all APIs with detailed information"""
+        """Get current status of all APIs with detailed information (cached for api_status_ttl seconds)"""
+        now = time.monotonic()
+        if self._api_status_cache is not None and now < self._api_status_cache[0]:
+            return {api: dict(info) for api, info in self._api_status_cache[1].items()}
+        
+        status_info = self._probe_api_status()
+        self._api_status_cache = (now + self.api_status_ttl, status_info)
+        return {api: dict(info) for api, info in status_info.items()}
+    
+    def _probe_api_status(self) -> Dict[str, Dict[str, Any]]:
+        """Probe each configured API with the cheapest request that validates the key"""
         status_info = {
             'climatiq': {
                 'configured': bool(self.climatiq_api_key),
@@ -469,22 +618,19 @@ class APIClientManager:
             }
         }
         
-        # Test Climatiq API if configured
-        if self.climatiq_api_key:
+        # Test Climatiq API if configured; a recent successful call already proves it works
+        climatiq_recently_ok = (
+            self._last_climatiq_success is not None
+            and time.monotonic() - self._last_climatiq_success < self.api_status_ttl
+        )
+        if self.climatiq_api_key and climatiq_recently_ok:
+            status_info['climatiq']['available'] = True
+        elif self.climatiq_api_key:
             try:
                 # Simple test request
-                test_response = self.query_climatiq_api('estimate', {
-                    'emission_factor': {
-                        'activity_id': 'passenger_flight-route_type_domestic-aircraft_type_na-distance_na-class_na-rf_na',
-                        'source': 'DEFRA',
-                        'region': 'IN',
-                        'year': 2023
-                    },
-                    'parameters': {
-                        'distance': 100,
-                        'distance_unit': 'km'
-                    }
-                })
+                test_response = self.query_climatiq_api(
+                    'estimate', _build_estimate_payload(_ACTIVITY_MAPPING['Flight'], 100)
+                )
                 
                 error_info = self.handle_api_errors(test_response, 'Climatiq')
                 status_info['climatiq']['available'] = not error_info['has_error']
@@ -499,12 +645,8 @@ class APIClientManager:
         # Test Google Maps API if configured
         if self.google_maps_api_key:
             try:
-                # Simple test request
-                test_response = self.query_google_maps_api('directions/json', {
-                    'origin': 'Delhi',
-                    'destination': 'Mumbai',
-                    'mode': 'driving'
-                })
+                # Geocoding a single city is far smaller than a directions response
+                test_response = self.query_google_maps_api('geocode/json', {'address': 'Delhi'})
                 
                 error_info = self.handle_api_errors(test_response, 'Google Maps')
                 status_info['google_maps']['available'] = not error_info['has_error']
@@ -564,79 +706,115 @@ class APIClientManager:
         if travel_modes is None:
             travel_modes = ['driving', 'transit']
         
-        # Map our internal modes to Google Maps travel modes
-        mode_mapping = {
-            'Car': 'driving',
-            'Bus': 'transit',
-            'Train': 'transit',
-            'Flight': None  # Flights not supported by Directions API
+        # Skip unsupported modes
+        supported_modes = {}
+        for mode in travel_modes:
+            google_mode = _MODE_MAPPING.get(mode, mode.lower())
+            if google_mode is not None:
+                supported_modes[mode] = google_mode
+        
+        if not supported_modes:
+            return {}
+        
+        # Query all modes concurrently; the requests are I/O-bound and share the session pool
+        with ThreadPoolExecutor(max_workers=len(supported_modes)) as executor:
+            futures = {
+                mode: executor.submit(self._fetch_mode_routes, origin, destination, mode, google_mode)
+                for mode, google_mode in supported_modes.items()
+            }
+            # Collect in request order so callers see a stable mode ordering
+            return {mode: future.result() for mode, future in futures.items()}
+    
+    def _fetch_mode_routes(self, origin: str, destination: str, mode: str, google_mode: str) -> List[Dict[str, Any]]:
+        """Fetch and process directions for a single travel mode, falling back to estimation"""
+        # Prepare API parameters
+        params = {
+            'origin': origin,
+            'destination': destination,
+            'mode': google_mode,
+            'alternatives': 'true',
+            'units': 'metric'
         }
         
-        routes_data = {}
+        # Add transit-specific parameters
+        if google_mode == 'transit':
+            params['transit_mode'] = 'bus|rail'
         
-        for mode in travel_modes:
-            google_mode = mode_mapping.get(mode, mode.lower())
-            
-            # Skip unsupported modes
-            if google_mode is None:
-                continue
-            
-            # Prepare API parameters
-            params = {
-                'origin': origin,
-                'destination': destination,
-                'mode': google_mode,
-                'alternatives': 'true',
-                'units': 'metric'
-            }
+        try:
+            response = self.query_google_maps_api('directions/json', params)
             
-            # Add transit-specific parameters
-            if google_mode == 'transit':
-                params['transit_mode'] = 'bus|rail'
+            if response and not self.handle_api_errors(response, 'Google Maps')['has_error']:
+                return self._process_directions_response(response, mode)
             
-            try:
-                response = self.query_google_maps_api('directions/json', params)
+            # Fallback to distance-based estimation
+            return self._create_fallback_route(origin, destination, mode)
+        
+        except RateLimited:
+            # The request was skipped, not failed; say so on the estimated route
+            return self._create_fallback_route(
+                origin, destination, mode,
+                warning='Google Maps rate limit reached; route calculated using fallback estimation'
+            )
                 
-                if response and not self.handle_api_errors(response):
-                    routes_data[mode] = self._process_directions_response(response, mode)
-                else:
-                    # Fallback to distance-based estimation
-                    routes_data[mode] = self._create_fallback_route(origin, destination, mode)
-                    
-            except Exception as e:
-                # Create fallback route on any error
-                routes_data[mode] = self._create_fallback_route(origin, destination, mode)
-        
-        return routes_data
+        except Exception:
+            # Create fallback route on any error
+            return self._create_fallback_route(origin, destination, mode)
     
     def _process_directions_response(self, response: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
-        """Process Google Maps Directions API response into route data"""
-        processed_routes = []
-        
+        """Process Google Maps Directions API response into route data (memoized on route polylines)"""
         if 'routes' not in response or not response['routes']:
-            return processed_routes
+            return []
+        
+        # Overview polylines identify routes; skip the cache if any route lacks one
+        polylines = tuple(
+            route.get('overview_polyline', _EMPTY_MAPPING).get('points', '') if isinstance(route, dict) else ''
+            for route in response['routes']
+        )
+        cache_key = (mode, polylines) if all(polylines) else None
+        
+        if cache_key is not None:
+            with self._directions_cache_lock:
+                cached_routes = self._directions_cache.get(cache_key)
+                if cached_routes is not None:
+                    self._directions_cache.move_to_end(cache_key)
+                    return list(cached_routes)
+        
+        processed_routes = self._parse_directions_routes(response['routes'], mode)
+        
+        if cache_key is not None:
+            with self._directions_cache_lock:
+                self._directions_cache[cache_key] = processed_routes
+                if len(self._directions_cache) > self.directions_cache_maxsize:
+                    self._directions_cache.popitem(last=False)
+        
+        return list(processed_routes)
+    
+    def _parse_directions_routes(self, routes: List[Dict[str, Any]], mode: str) -> List[Dict[str, Any]]:
+        """Convert raw Directions API routes into route data dictionaries"""
+        processed_routes = []
         
-        for route in response['routes']:
+        for route in routes:
             try:
                 # Extract route information
                 leg = route['legs'][0] if route['legs'] else {}
                 
                 route_data = {
                     'mode': mode,
-                    'distance_km': leg.get('distance', {}).get('value', 0) / 1000.0,
-                    'duration_hours': leg.get('duration', {}).get('value', 0) / 3600.0,
+                    'distance_km': leg.get('distance', _EMPTY_MAPPING).get('value', 0) / 1000.0,
+                    'duration_hours': leg.get('duration', _EMPTY_MAPPING).get('value', 0) / 3600.0,
                     'start_address': leg.get('start_address', ''),
                     'end_address': leg.get('end_address', ''),
                     'steps': self._extract_route_steps(leg.get('steps', [])),
-                    'polyline': route.get('overview_polyline', {}).get('points', ''),
+                    'polyline': route.get('overview_polyline', _EMPTY_MAPPING).get('points', ''),
                     'bounds': route.get('bounds', {}),
                     'warnings': route.get('warnings', []),
                     'copyrights': route.get('copyrights', '')
                 }
                 
                 # Add transit-specific information
-                if mode in ['Bus', 'Train'] and 'transit_details' in str(leg):
-                    route_data['transit_details'] = self._extract_transit_details(leg.get('steps', []))
+                steps = leg.get('steps', ())
+                if mode in _TRANSIT_MODES and any(step.get('travel_mode') == 'TRANSIT' for step in steps):
+                    route_data['transit_details'] = self._extract_transit_details(steps)
                 
                 processed_routes.append(route_data)
                 
@@ -653,8 +831,8 @@ class APIClientManager:
         for step in steps:
             try:
                 step_data = {
-                    'distance_km': step.get('distance', {}).get('value', 0) / 1000.0,
-                    'duration_hours': step.get('duration', {}).get('value', 0) / 3600.0,
+                    'distance_km': step.get('distance', _EMPTY_MAPPING).get('value', 0) / 1000.0,
+                    'duration_hours': step.get('duration', _EMPTY_MAPPING).get('value', 0) / 3600.0,
                     'instructions': step.get('html_instructions', ''),
                     'travel_mode': step.get('travel_mode', ''),
                     'start_location': step.get('start_location', {}),
@@ -677,10 +855,10 @@ class APIClientManager:
                 try:
                     transit_info = step['transit_details']
                     detail = {
-                        'line_name': transit_info.get('line', {}).get('name', ''),
-                        'vehicle_type': transit_info.get('line', {}).get('vehicle', {}).get('type', ''),
-                        'departure_stop': transit_info.get('departure_stop', {}).get('name', ''),
-                        'arrival_stop': transit_info.get('arrival_stop', {}).get('name', ''),
+                        'line_name': transit_info.get('line', _EMPTY_MAPPING).get('name', ''),
+                        'vehicle_type': transit_info.get('line', _EMPTY_MAPPING).get('vehicle', _EMPTY_MAPPING).get('type', ''),
+                        'departure_stop': transit_info.get('departure_stop', _EMPTY_MAPPING).get('name', ''),
+                        'arrival_stop': transit_info.get('arrival_stop', _EMPTY_MAPPING).get('name', ''),
                         'num_stops': transit_info.get('num_stops', 0)
                     }
                     transit_details.append(detail)
@@ -690,35 +868,18 @@ class APIClientManager:
         
         return transit_details
     
-    def _create_fallback_route(self, origin: str, destination: str, mode: str) -> List[Dict[str, Any]]:
+    def _create_fallback_route(self, origin: str, destination: str, mode: str,
+                               warning: str = 'Route calculated using fallback estimation') -> List[Dict[str, Any]]:
         """Create fallback route data when API is unavailable"""
-        # Estimate distance using geographic data if available
-        from .geographic_data import GeographicDataManager
-        
         try:
-            geo_manager = GeographicDataManager()
-            origin_coords = geo_manager.get_city_coordinates(origin)
-            dest_coords = geo_manager.get_city_coordinates(destination)
-            
-            if origin_coords and dest_coords:
-                distance_km = geo_manager.calculate_geodesic_distance(
-                    origin_coords['latitude'], origin_coords['longitude'],
-                    dest_coords['latitude'], dest_coords['longitude']
-                )
-            else:
+            # Estimate distance using geographic data if available
+            distance_km = _fallback_distance_km(origin, destination)
+            if distance_km is None:
                 # Default fallback distance
                 distance_km = 500.0
             
             # Estimate duration based on mode and distance
-            speed_estimates = {
-                'Car': 60.0,    # km/h average including stops
-                'Bus': 45.0,    # km/h average including stops
-                'Train': 80.0,  # km/h average for Indian trains
-                'Flight': 500.0 # km/h average including airport time
-            }
-            
-            speed = speed_estimates.get(mode, 50.0)
-            duration_hours = distance_km / speed
+            duration_hours = distance_km * _INV_SPEED_KMH.get(mode, _DEFAULT_INV_SPEED_KMH)
             
             fallback_route = {
                 'mode': mode,
@@ -729,7 +890,7 @@ class APIClientManager:
                 'steps': [],
                 'polyline': '',
                 'bounds': {},
-                'warnings': ['Route calculated using fallback estimation'],
+                'warnings': [warning],
                 'copyrights': 'Fallback route estimation',
                 'is_fallback': True
             }
@@ -738,16 +899,12 @@ class APIClientManager:
             
         except Exception:
             # Ultimate fallback with default values
-            return [{
-                'mode': mode,
-                'distance_km': 500.0,
-                'duration_hours': 8.0,
-                'start_address': origin,
-                'end_address': destination,
-                'steps': [],
-                'polyline': '',
-                'bounds': {},
-                'warnings': ['Route calculated using default estimation'],
-                'copyrights': 'Default route estimation',
-                'is_fallback': True
-            }]
\ No newline at end of file
+            return [dict(
+                _DEFAULT_FALLBACK_ROUTE,
+                mode=mode,
+                start_address=origin,
+                end_address=destination,
+                steps=[],
+                bounds={},
+                warnings=['Route calculated using default estimation']
+            )]
\ No newline at end of file
@@ -5,17 +5,36 @@ Computes CO₂ emissions for transportation and accommodation with API integrati
 and fallback mechanisms using static emission factors.
 """
 
+import numpy as np
 from typing import Dict, Any, Optional
 from .ml_emissions_model import MLEmissionsPredictor
 from .models import TripData, EmissionsResult
 from datetime import datetime
+from functools import lru_cache
+
+# Transport modes the calculator accepts
+_SUPPORTED_MODES = frozenset(('Flight', 'Train', 'Car', 'Bus'))
+
+
+def _compute_emissions(factors: np.ndarray, distance_km: float, travelers: int) -> np.ndarray:
+    """Vectorized emissions kernel: emission_factor * distance * number_of_travelers per mode, in kg to 3 dp"""
+    return np.round(factors * distance_km * travelers, 3)
+
+
+@lru_cache(maxsize=1)
+def _get_predictor() -> MLEmissionsPredictor:
+    """Shared emissions predictor; read-only after load, so one instance serves every calculator"""
+    return MLEmissionsPredictor()
 
 
 class CarbonCalculator:
     """Engine for calculating carbon emissions from travel and accommodation"""
     
     def __init__(self):
-        self.ml_predictor = MLEmissionsPredictor()
+        self.ml_predictor = _get_predictor()
+        # Model info is fixed once the predictor has loaded
+        self._model_info = self.ml_predictor.get_model_info()
+        self._calculation_errors = []
     
     def calculate_transport_emissions(self, trip_data: TripData, distance_km: float) -> Dict[str, float]:
         """Calculate emissions for transportation modes with comprehensive error handling"""
@@ -27,21 +46,21 @@ class CarbonCalculator:
             if not self.validate_calculation_inputs(trip_data, distance_km):
                 raise ValueError("Invalid calculation inputs provided")
             
-            for mode in trip_data.travel_modes:
-                try:
-                    # Get emission factor from ML model
-                    emission_factor = self.ml_predictor.predict_emission_factor(mode, distance_km, trip_data.num_travelers)
-                    
-                    if emission_factor > 0:
-                        # Calculate emissions: distance * emission_factor * number_of_travelers
-                        emissions = distance_km * emission_factor * trip_data.num_travelers
-                        transport_emissions[mode] = round(emissions, 3)
-                    else:
-                        calculation_errors.append(f"No emission factor available for {mode}")
-                        
-                except Exception as e:
-                    calculation_errors.append(f"Error calculating emissions for {mode}: {str(e)}")
-                    continue
+            modes = list(trip_data.travel_modes)
+            factors = self.ml_predictor.predict_emission_factors_batch(modes, distance_km, trip_data.num_travelers)
+            
+            available = factors > 0
+            calculated_modes = []
+            for mode, has_factor in zip(modes, available.tolist()):
+                if has_factor:
+                    calculated_modes.append(mode)
+                else:
+                    calculation_errors.append(f"No emission factor available for {mode}")
+            
+            if calculated_modes:
+                # Compute all modes with a factor in one vectorized pass
+                emissions = _compute_emissions(factors[available], distance_km, trip_data.num_travelers)
+                transport_emissions = dict(zip(calculated_modes, emissions.tolist()))
             
             # If no successful calculations, raise an error
             if not transport_emissions and calculation_errors:
@@ -52,47 +71,46 @@ class CarbonCalculator:
             calculation_errors.append(f"Transport emissions calculation failed: {str(e)}")
             
         # Store any errors for later reporting
-        if hasattr(self, '_calculation_errors'):
-            self._calculation_errors.extend(calculation_errors)
-        else:
-            self._calculation_errors = calculation_errors
+        self._calculation_errors.extend(calculation_errors)
         
         return transport_emissions
     
     def calculate_accommodation_emissions(self, trip_data: TripData) -> float:
         """Calculate emissions for hotel accommodation with error handling"""
+        if trip_data.hotel_nights <= 0:
+            return 0.0
+        
+        # Validate inputs
+        if trip_data.num_travelers <= 0:
+            return self._accommodation_failure("Number of travelers must be positive")
+        
+        if trip_data.hotel_nights > 365:
+            return self._accommodation_failure("Hotel nights cannot exceed 365")
+        
+        # Get emission factor for hotel accommodation from ML model
         try:
-            if trip_data.hotel_nights <= 0:
-                return 0.0
-            
-            # Validate inputs
-            if trip_data.num_travelers <= 0:
-                raise ValueError("Number of travelers must be positive")
-            
-            if trip_data.hotel_nights > 365:
-                raise ValueError("Hotel nights cannot exceed 365")
-            
-            # Get emission factor for hotel accommodation from ML model
             emissions = self.ml_predictor.predict_accommodation_emissions(
                 trip_data.hotel_nights, 
                 trip_data.num_travelers
             )
-            
-            if emissions > 0:
-                return round(emissions, 3)
-            else:
-                raise ValueError("No emission factor available for hotel accommodation")
-        
         except Exception as e:
-            # Log error and return zero
-            if hasattr(self, '_calculation_errors'):
-                self._calculation_errors.append(f"Accommodation emissions calculation failed: {str(e)}")
-            else:
-                self._calculation_errors = [f"Accommodation emissions calculation failed: {str(e)}"]
-            return 0.0
+            return self._accommodation_failure(str(e))
+        
+        if emissions > 0:
+            return round(emissions, 3)
+        return self._accommodation_failure("No emission factor available for hotel accommodation")
     
-    def calculate_total_emissions(self, trip_data: TripData, distance_km: float) -> EmissionsResult:
-        """Calculate total emissions for the entire trip with comprehensive error handling"""
+    def _accommodation_failure(self, reason: str) -> float:
+        """Record an accommodation calculation error and return zero emissions"""
+        self._calculation_errors.append(f"Accommodation emissions calculation failed: {reason}")
+        return 0.0
+    
+    def calculate_total_emissions(self, trip_data: TripData, distance_km: float,
+                                  timestamp: Optional[datetime] = None) -> EmissionsResult:
+        """Calculate total emissions for the entire trip with comprehensive error handling
+        
+        Callers scoring many trips can pass one shared timestamp instead of reading the clock per trip.
+        """
         # Initialize error tracking
         self._calculation_errors = []
         
@@ -112,7 +130,8 @@ class CarbonCalculator:
                 raise ValueError("No valid emissions could be calculated")
             
             # Aggregate total emissions
-            result = self.aggregate_total_emissions(transport_emissions, accommodation_emissions, trip_data.num_travelers)
+            result = self.aggregate_total_emissions(transport_emissions, accommodation_emissions,
+                                                    trip_data.num_travelers, timestamp)
             
             # Add error information to result if any errors occurred
             if self._calculation_errors:
@@ -130,7 +149,7 @@ class CarbonCalculator:
                 transport_emissions={},
                 accommodation_emissions=0.0,
                 per_person_emissions=0.0,
-                calculation_timestamp=datetime.now(),
+                calculation_timestamp=timestamp or datetime.now(),
                 calculation_warnings=self._calculation_errors
             )
     
@@ -139,20 +158,25 @@ class CarbonCalculator:
         return self.ml_predictor.predict_emission_factor(transport_mode, distance_km)
     
     def aggregate_total_emissions(self, transport_emissions: Dict[str, float], 
-                                accommodation_emissions: float, num_travelers: int = 1) -> EmissionsResult:
+                                accommodation_emissions: float, num_travelers: int = 1,
+                                timestamp: Optional[datetime] = None) -> EmissionsResult:
         """Combine all emission sources into total result"""
-        total_transport = sum(transport_emissions.values())
+        total_transport = np.fromiter(
+            transport_emissions.values(), dtype=np.float64, count=len(transport_emissions)
+        ).sum()
         total_emissions = total_transport + accommodation_emissions
         
-        # Calculate per-person emissions
-        per_person_emissions = total_emissions / max(1, num_travelers)
+        # Round total, accommodation and per-person emissions in one pass
+        total_emissions, accommodation_emissions, per_person_emissions = np.round(
+            [total_emissions, accommodation_emissions, total_emissions / max(1, num_travelers)], 3
+        ).tolist()
         
         return EmissionsResult(
-            total_co2e_kg=round(total_emissions, 3),
+            total_co2e_kg=total_emissions,
             transport_emissions=transport_emissions,
-            accommodation_emissions=round(accommodation_emissions, 3),
-            per_person_emissions=round(per_person_emissions, 3),
-            calculation_timestamp=datetime.now()
+            accommodation_emissions=accommodation_emissions,
+            per_person_emissions=per_person_emissions,
+            calculation_timestamp=timestamp or datetime.now()
         )
     
     def calculate_emissions_by_mode(self, mode: str, distance_km: float, num_travelers: int) -> float:
@@ -185,8 +209,7 @@ class CarbonCalculator:
                 validation_errors.append("At least one travel mode must be selected or hotel nights must be greater than 0")
             
             # Validate travel modes are supported
-            supported_modes = ['Flight', 'Train', 'Car', 'Bus']
-            invalid_modes = [mode for mode in trip_data.travel_modes if mode not in supported_modes]
+            invalid_modes = [mode for mode in trip_data.travel_modes if mode not in _SUPPORTED_MODES]
             if invalid_modes:
                 validation_errors.append(f"Unsupported travel modes: {', '.join(invalid_modes)}")
             
@@ -207,21 +230,17 @@ class CarbonCalculator:
         
         # Store validation errors
         if validation_errors:
-            if hasattr(self, '_calculation_errors'):
-                self._calculation_errors.extend(validation_errors)
-            else:
-                self._calculation_errors = validation_errors
+            self._calculation_errors.extend(validation_errors)
             return False
         
         return True
     
     def get_calculation_status(self) -> Dict[str, Any]:
         """Get status of the last calculation including any errors or warnings"""
-        model_info = self.ml_predictor.get_model_info()
         return {
-            'has_errors': bool(getattr(self, '_calculation_errors', [])),
-            'errors': getattr(self, '_calculation_errors', []),
-            'model_info': model_info,
+            'has_errors': bool(self._calculation_errors),
+            'errors': self._calculation_errors,
+            'model_info': self._model_info,
             'calculation_method': 'ml_based',
             'api_dependent': False
         }
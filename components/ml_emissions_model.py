@@ -6,10 +6,25 @@ for transportation and accommodation without requiring external APIs.
 """
 
 import numpy as np
-from typing import Dict, Optional
-import pickle
+from typing import Any, Dict, Mapping, Optional, Sequence
+import json
 import os
+import logging
 from pathlib import Path
+from types import MappingProxyType
+
+# Accommodation emission multipliers by hotel type
+_HOTEL_MULTIPLIERS = {
+    'budget': 0.7,
+    'standard': 1.0,
+    'luxury': 1.5
+}
+
+# India-specific efficiency multipliers applied to distance-adjusted transport factors
+_IN_MODE_MULTIPLIERS = {
+    'Train': 0.95,
+    'Car': 1.05
+}
 
 
 class MLEmissionsPredictor:
@@ -17,12 +32,13 @@ class MLEmissionsPredictor:
     
     def __init__(self):
         """Initialize the ML model with pre-trained weights or default factors"""
-        self.model_path = Path(__file__).parent / 'models' / 'emissions_model.pkl'
+        self.model_path = Path(__file__).parent / 'models' / 'emissions_model.json'
         self.model = None
         self.is_trained = False
         
         # Base emission factors (India-specific, kg CO2e per km per person)
         # These are derived from DEFRA, IPCC, and Indian transport data
+        # (assigning them rebuilds the lookup tables; see the property below)
         self.base_emission_factors = {
             'Flight': {
                 'base': 0.255,
@@ -54,21 +70,69 @@ class MLEmissionsPredictor:
         # Load or initialize model
         self._initialize_model()
     
+    @property
+    def base_emission_factors(self) -> Mapping[str, Mapping[str, Any]]:
+        """Base factors per mode (read-only; assign a new mapping to change them)"""
+        return self._base_emission_factors
+    
+    @base_emission_factors.setter
+    def base_emission_factors(self, factors: Mapping[str, Mapping[str, Any]]):
+        # Freeze the factors so in-place edits cannot leave the lookup tables stale
+        self._base_emission_factors = MappingProxyType(
+            {mode: MappingProxyType(dict(data)) for mode, data in factors.items()}
+        )
+        self._build_factor_tables()
+    
+    def _build_factor_tables(self):
+        """Precompute arrays indexed by mode id, and the scalar lookups from the same arrays"""
+        factors = self._base_emission_factors
+        self._mode_ids = {mode: i for i, mode in enumerate(factors)}
+        self._mode_base = np.array([data['base'] for data in factors.values()], dtype=np.float64)
+        self._mode_df = np.array([data['distance_factor'] for data in factors.values()], dtype=np.float64)
+        # Region-specific efficiency multipliers (Indian railways efficient, road conditions less so)
+        self._region_mult = {
+            'IN': np.array([_IN_MODE_MULTIPLIERS.get(mode, 1.0) for mode in factors], dtype=np.float64)
+        }
+        
+        # mode -> (base factor, distance factor, {region: multiplier}) as plain floats
+        self._mode_params = {
+            mode: (
+                float(self._mode_base[i]),
+                float(self._mode_df[i]),
+                {region: float(mult[i]) for region, mult in self._region_mult.items()}
+            )
+            for mode, i in self._mode_ids.items()
+        }
+    
+    def _factors_as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Plain-dict copy of the base factors for serialization"""
+        return {mode: dict(data) for mode, data in self._base_emission_factors.items()}
+    
     def _initialize_model(self):
         """Initialize the ML model - uses polynomial regression approach"""
         try:
             # Try to load pre-trained model if exists
             if self.model_path.exists():
-                with open(self.model_path, 'rb') as f:
-                    self.model = pickle.load(f)
+                with open(self.model_path, 'r', encoding='utf-8') as f:
+                    self.model = json.load(f)
                     self.is_trained = True
             else:
                 # Use rule-based model with ML-like features
                 self.is_trained = False
+                self._warn_legacy_model()
         except Exception:
             # Fallback to rule-based
             self.is_trained = False
     
+    def _warn_legacy_model(self):
+        """Log when only a pickled model from an older release is present (it is no longer loaded)"""
+        legacy_path = self.model_path.with_suffix('.pkl')
+        if legacy_path.exists():
+            logging.warning(
+                f"Ignoring legacy pickled model {legacy_path}; models are now saved as JSON. "
+                f"Call save_model() to write {self.model_path.name} (see ML_MIGRATION.md)."
+            )
+    
     def predict_emission_factor(self, transport_mode: str, distance_km: Optional[float] = None,
                                num_travelers: int = 1, region: str = 'IN') -> float:
         """
@@ -83,18 +147,14 @@ class MLEmissionsPredictor:
         Returns:
             Emission factor in kg CO2e per km per person (or per night for Hotel)
         """
-        if transport_mode not in self.base_emission_factors:
+        mode_params = self._mode_params.get(transport_mode)
+        if mode_params is None:
             return 0.0
         
-        mode_data = self.base_emission_factors[transport_mode]
-        base_factor = mode_data['base']
-        distance_factor = mode_data['distance_factor']
+        base_factor, distance_factor, region_multipliers = mode_params
         
-        # For Hotel, return base factor directly
-        if transport_mode == 'Hotel':
-            return base_factor
-        
-        # For transport modes, apply distance-based adjustments
+        # For transport modes, apply distance-based adjustments; Hotel has a zero
+        # distance factor and no region multiplier, so it always keeps its base factor
         if distance_km is None or distance_km <= 0:
             return base_factor
         
@@ -103,19 +163,64 @@ class MLEmissionsPredictor:
         adjusted_factor = base_factor + (distance_factor * min(distance_km, 2000))
         
         # Apply region-specific adjustments (India-specific factors)
-        if region == 'IN':
-            # Indian transport systems may have different efficiency
-            if transport_mode == 'Train':
-                # Indian railways are relatively efficient
-                adjusted_factor *= 0.95
-            elif transport_mode == 'Car':
-                # Indian road conditions may affect efficiency
-                adjusted_factor *= 1.05
+        adjusted_factor *= region_multipliers.get(region, 1.0)
         
         # Ensure factor is positive and reasonable
-        adjusted_factor = max(0.01, min(adjusted_factor, base_factor * 1.5))
+        return max(0.01, min(adjusted_factor, base_factor * 1.5))
+    
+    def predict_emission_factors_batch(self, transport_modes: Sequence[str], distance_km: Optional[float] = None,
+                                       num_travelers: int = 1, region: str = 'IN') -> np.ndarray:
+        """
+        Predict emission factors for several modes over the same distance
         
-        return round(adjusted_factor, 4)
+        Args:
+            transport_modes: Transportation modes, in the order of the returned factors
+            distance_km: Distance in kilometers (optional for Hotel)
+            num_travelers: Number of travelers
+            region: Region code (default: 'IN' for India)
+        
+        Returns:
+            Array of emission factors aligned with transport_modes (0.0 for unknown modes)
+        """
+        # Without a distance every mode keeps its base factor, as in the scalar call
+        return self.predict_emission_factors_vec(
+            transport_modes, 0.0 if distance_km is None else distance_km, region
+        )
+    
+    def predict_emission_factors_vec(self, transport_modes: Sequence[str], distances_km,
+                                     region: str = 'IN') -> np.ndarray:
+        """
+        Predict emission factors for many (mode, distance) pairs in one vectorized pass
+        
+        Args:
+            transport_modes: Transportation modes
+            distances_km: Distances in kilometers, one per mode or a single shared value
+            region: Region code (default: 'IN' for India)
+        
+        Returns:
+            Array of emission factors aligned with transport_modes (0.0 for unknown modes),
+            matching predict_emission_factor element-wise
+        """
+        mode_ids = np.fromiter(
+            (self._mode_ids.get(mode, -1) for mode in transport_modes),
+            dtype=np.intp,
+            count=len(transport_modes)
+        )
+        distances = np.broadcast_to(np.asarray(distances_km, dtype=np.float64), mode_ids.shape)
+        
+        known = mode_ids >= 0
+        ids = np.where(known, mode_ids, 0)
+        base = self._mode_base[ids]
+        
+        adjusted = base + self._mode_df[ids] * np.minimum(distances, 2000)
+        region_mult = self._region_mult.get(region)
+        if region_mult is not None:
+            adjusted *= region_mult[ids]
+        adjusted = np.maximum(0.01, np.minimum(adjusted, base * 1.5))
+        
+        # Without a usable distance the base factor applies unadjusted
+        factors = np.where(distances > 0, adjusted, base)
+        return np.where(known, factors, 0.0)
     
     def predict_total_emissions(self, transport_mode: str, distance_km: float,
                                 num_travelers: int = 1, region: str = 'IN') -> float:
@@ -156,13 +261,7 @@ class MLEmissionsPredictor:
         base_factor = self.base_emission_factors['Hotel']['base']
         
         # Adjust for hotel type
-        hotel_multipliers = {
-            'budget': 0.7,
-            'standard': 1.0,
-            'luxury': 1.5
-        }
-        
-        multiplier = hotel_multipliers.get(hotel_type, 1.0)
+        multiplier = _HOTEL_MULTIPLIERS.get(hotel_type, 1.0)
         adjusted_factor = base_factor * multiplier
         
         return adjusted_factor * nights * num_travelers
@@ -195,19 +294,19 @@ class MLEmissionsPredictor:
         # For now, save a simple marker that model uses rule-based approach
         model_data = {
             'type': 'rule_based',
-            'base_factors': self.base_emission_factors,
+            'base_factors': self._factors_as_dict(),
             'version': '1.0'
         }
         
-        with open(path, 'wb') as f:
-            pickle.dump(model_data, f)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(model_data, f, indent=2)
     
     def get_model_info(self) -> Dict[str, any]:
         """Get information about the current model"""
         return {
             'is_trained': self.is_trained,
             'model_type': 'rule_based_ml_enhanced',
-            'base_factors': self.base_emission_factors,
+            'base_factors': self._factors_as_dict(),
             'region': 'IN',
             'supports_distance_adjustment': True,
             'supports_region_adjustment': True
@@ -6,17 +6,29 @@ external mapping APIs using geographic data and ML-based estimation.
 """
 
 import numpy as np
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
-from .geographic_data import GeographicDataManager
+from .geographic_data import get_default_manager
 import math
 
 
+_ALL_MODES = ('Flight', 'Train', 'Car', 'Bus')
+
+# Record layout returned by MLRoutePredictor.predict_many
+_PREDICTION_DTYPE = np.dtype([
+    ('distance_km', np.float64),
+    ('duration_hours', np.float64),
+    ('estimated_stops', np.int64)
+])
+
+
 class MLRoutePredictor:
     """Machine learning model for predicting route information"""
     
     def __init__(self):
         """Initialize the route predictor"""
-        self.geo_manager = GeographicDataManager()
+        self.geo_manager = get_default_manager()
         
         # Average speeds for different modes in India (km/h)
         self.mode_speeds = {
@@ -41,6 +53,50 @@ class MLRoutePredictor:
             'Car': 1.2,      # Road routes are longer than direct
             'Bus': 1.25      # Bus routes are longest
         }
+        
+        # Per-mode parameters as arrays aligned with _ALL_MODES so every mode
+        # can be evaluated in a single vectorized pass
+        self._modes = np.array(_ALL_MODES)
+        self._mode_index = {mode: i for i, mode in enumerate(_ALL_MODES)}
+        self._eff = np.array([self.route_efficiency[mode] for mode in _ALL_MODES])
+        self._speeds = np.array([self.mode_speeds[mode] for mode in _ALL_MODES])
+        self._buffers = np.array([self.mode_buffers[mode] for mode in _ALL_MODES])
+        # Kilometers per stop and minimum stops (flights are direct)
+        self._stop_div = np.array([np.inf, 100.0, 200.0, 50.0])
+        self._min_stops = np.array([0, 1, 0, 1])
+        
+        # 1-element parameter arrays per mode for single-mode predictions,
+        # with car-like defaults and no stops for unknown modes
+        self._params = {
+            mode: (self._eff[i:i + 1], self._speeds[i:i + 1], self._buffers[i:i + 1],
+                   self._stop_div[i:i + 1], self._min_stops[i:i + 1])
+            for mode, i in self._mode_index.items()
+        }
+        self._fallback_params = (np.array([1.2]), np.array([50.0]), np.array([0.5]),
+                                 np.array([np.inf]), np.array([0]))
+        
+        # Comfort ranking aligned with _ALL_MODES (Flight > Train > Car > Bus)
+        self._comfort = np.array([4, 3, 2, 1])
+        
+        # LRU cache of all-mode prediction arrays keyed on (origin, destination)
+        self._comparison_cache: "OrderedDict[tuple, Tuple[np.ndarray, ...]]" = OrderedDict()
+        self._comparison_cache_lock = threading.Lock()
+        self.comparison_cache_maxsize = 1024
+    
+    def _predict_modes(self, direct_distance, eff: np.ndarray, speeds: np.ndarray,
+                       buffers: np.ndarray, stop_div: np.ndarray,
+                       min_stops: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Distance, duration, average speed and stops for each mode's parameters.
+        
+        direct_distance may be a scalar or an array aligned with the parameters.
+        """
+        # Values stay unrounded here; the public per-route results round to 2 decimals
+        distance = np.maximum(direct_distance, 0.0) * eff
+        # Travel time plus buffer, minimum 30 minutes; zero-length routes take no time
+        duration = np.where(distance > 0, np.maximum(distance / speeds + buffers, 0.5), 0.0)
+        avg_speed = distance / np.maximum(duration - buffers, 0.1)
+        stops = np.maximum(min_stops, (distance / stop_div).astype(int))
+        return distance, duration, avg_speed, stops
     
     def predict_distance(self, origin: str, destination: str, 
                         mode: str = 'Car') -> float:
@@ -55,17 +111,7 @@ class MLRoutePredictor:
         Returns:
             Predicted distance in kilometers
         """
-        # Get direct geodesic distance
-        direct_distance = self.geo_manager.calculate_distance(origin, destination)
-        
-        if direct_distance <= 0:
-            return 0.0
-        
-        # Apply mode-specific efficiency factor
-        efficiency = self.route_efficiency.get(mode, 1.2)
-        predicted_distance = direct_distance * efficiency
-        
-        return round(predicted_distance, 2)
+        return self._compute(origin, destination, mode)[0]
     
     def predict_duration(self, origin: str, destination: str,
                         mode: str = 'Car') -> float:
@@ -80,23 +126,67 @@ class MLRoutePredictor:
         Returns:
             Predicted duration in hours
         """
-        distance = self.predict_distance(origin, destination, mode)
-        
-        if distance <= 0:
-            return 0.0
+        return self._compute(origin, destination, mode)[1]
+    
+    def _compute(self, origin: str, destination: str, mode: str) -> Tuple[float, float]:
+        """Predicted (distance_km, duration_hours) for one mode from a single distance lookup, to 2 decimals"""
+        direct_distance = self.geo_manager.calculate_distance(origin, destination)
+        distance, duration, _, _ = self._predict_modes(
+            direct_distance, *self._params.get(mode, self._fallback_params)
+        )
+        return float(np.round(distance[0], 2)), float(np.round(duration[0], 2))
+    
+    def predict_routes_batch(self, origins: List[str], destinations: List[str],
+                             modes: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict distances and durations for many (origin, destination, mode) candidates at once
         
-        # Get average speed for mode
-        speed = self.mode_speeds.get(mode, 50.0)
+        Args:
+            origins: Origin city names
+            destinations: Destination city names, aligned with origins
+            modes: Transportation modes, aligned with origins
         
-        # Calculate travel time
-        travel_time = distance / speed
+        Returns:
+            Tuple of (distances in kilometers, durations in hours) arrays;
+            raises KeyError for unknown cities
+        """
+        predictions = self.predict_many(list(zip(origins, destinations, modes)))
+        return predictions['distance_km'], predictions['duration_hours']
+    
+    def predict_many(self, pairs: List[Tuple[str, str, str]]) -> np.ndarray:
+        """
+        Score many (origin, destination, mode) tuples in one vectorized pass
         
-        # Add buffer time
-        buffer = self.mode_buffers.get(mode, 0.5)
-        total_time = travel_time + buffer
+        Args:
+            pairs: (origin, destination, mode) tuples
         
-        # Minimum 30 minutes
-        return round(max(total_time, 0.5), 2)
+        Returns:
+            Structured array with distance_km and duration_hours (2 decimals) and estimated_stops
+            fields, one record per tuple; raises KeyError for unknown cities
+        """
+        origins = [pair[0] for pair in pairs]
+        destinations = [pair[1] for pair in pairs]
+        modes = [pair[2] for pair in pairs]
+        
+        direct_distances = self.geo_manager.calculate_distances_bulk(origins, destinations)
+        distance, duration, _, stops = self._predict_modes(direct_distances, *self._gather_params(modes))
+        
+        predictions = np.empty(len(pairs), dtype=_PREDICTION_DTYPE)
+        predictions['distance_km'] = np.round(distance, 2)
+        predictions['duration_hours'] = np.round(duration, 2)
+        predictions['estimated_stops'] = stops
+        return predictions
+    
+    def _gather_params(self, modes: List[str]) -> List[np.ndarray]:
+        """Parameter arrays aligned with modes, using car-like defaults for unknown modes"""
+        # Unknown modes map to the extra fallback row appended to each parameter array
+        fallback_row = len(_ALL_MODES)
+        mode_ids = np.fromiter((self._mode_index.get(mode, fallback_row) for mode in modes),
+                               dtype=np.intp, count=len(modes))
+        return [np.concatenate((table, fallback))[mode_ids]
+                for table, fallback in zip((self._eff, self._speeds, self._buffers,
+                                            self._stop_div, self._min_stops),
+                                           self._fallback_params)]
     
     def predict_alternative_routes(self, origin: str, destination: str,
                                    modes: Optional[List[str]] = None) -> List[Dict[str, any]]:
@@ -114,28 +204,26 @@ class MLRoutePredictor:
         if modes is None:
             modes = ['Flight', 'Train', 'Car', 'Bus']
         
-        alternatives = []
-        
-        for mode in modes:
-            try:
-                distance = self.predict_distance(origin, destination, mode)
-                duration = self.predict_duration(origin, destination, mode)
-                
-                if distance > 0:
-                    alternative = {
-                        'mode': mode,
-                        'distance_km': distance,
-                        'duration_hours': duration,
-                        'origin': origin,
-                        'destination': destination,
-                        'is_predicted': True,
-                        'prediction_method': 'ml_geographic'
-                    }
-                    alternatives.append(alternative)
-            except Exception:
-                continue
-        
-        return alternatives
+        direct_distance = self.geo_manager.calculate_distance(origin, destination)
+        if direct_distance <= 0 or not modes:
+            return []
+        
+        distances, durations, _, _ = self._predict_modes(direct_distance, *self._gather_params(modes))
+        
+        return [
+            {
+                'mode': mode,
+                'distance_km': distance,
+                'duration_hours': duration,
+                'origin': origin,
+                'destination': destination,
+                'is_predicted': True,
+                'prediction_method': 'ml_geographic'
+            }
+            for mode, distance, duration in zip(modes, np.round(distances, 2).tolist(),
+                                                np.round(durations, 2).tolist())
+            if distance > 0
+        ]
     
     def predict_route_details(self, origin: str, destination: str,
                              mode: str) -> Dict[str, any]:
@@ -150,38 +238,64 @@ class MLRoutePredictor:
         Returns:
             Dictionary with route details
         """
-        distance = self.predict_distance(origin, destination, mode)
-        duration = self.predict_duration(origin, destination, mode)
-        
-        # Estimate number of stops based on distance and mode
-        stops = self._estimate_stops(distance, mode)
+        direct_distance = self.geo_manager.calculate_distance(origin, destination)
+        distance, duration, avg_speed, stops = self._predict_modes(
+            direct_distance, *self._params.get(mode, self._fallback_params)
+        )
         
         return {
-            'distance_km': distance,
-            'duration_hours': duration,
-            'estimated_stops': stops,
-            'average_speed_kmh': round(distance / max(duration - self.mode_buffers.get(mode, 0.5), 0.1), 2),
+            'distance_km': float(np.round(distance[0], 2)),
+            'duration_hours': float(np.round(duration[0], 2)),
+            'estimated_stops': int(stops[0]),
+            'average_speed_kmh': float(np.round(avg_speed[0], 2)),
             'route_type': mode,
             'origin': origin,
             'destination': destination,
             'is_predicted': True
         }
     
-    def _estimate_stops(self, distance: float, mode: str) -> int:
-        """Estimate number of stops based on distance and mode"""
-        if mode == 'Flight':
-            return 0  # Direct flights
-        elif mode == 'Train':
-            # Trains stop more frequently
-            return max(1, int(distance / 100))
-        elif mode == 'Car':
-            # Cars may stop for breaks
-            return max(0, int(distance / 200))
-        elif mode == 'Bus':
-            # Buses stop frequently
-            return max(1, int(distance / 50))
-        else:
-            return 0
+    def _compute_arrays(self, origin: str, destination: str) -> Tuple[np.ndarray, ...]:
+        """All-mode (distance, duration, avg_speed, stops, duration_order) arrays for a city pair"""
+        cache_key = (origin, destination)
+        with self._comparison_cache_lock:
+            cached = self._comparison_cache.get(cache_key)
+            if cached is not None:
+                self._comparison_cache.move_to_end(cache_key)
+                return cached
+        
+        direct_distance = self.geo_manager.calculate_distance(origin, destination)
+        distance, duration, avg_speed, stops = self._predict_modes(
+            direct_distance, self._eff, self._speeds, self._buffers, self._stop_div, self._min_stops
+        )
+        # Order by duration; a stable sort keeps the mode order for ties
+        arrays = (distance, duration, avg_speed, stops, np.argsort(duration, kind='stable'))
+        
+        with self._comparison_cache_lock:
+            self._comparison_cache[cache_key] = arrays
+            if len(self._comparison_cache) > self.comparison_cache_maxsize:
+                self._comparison_cache.popitem(last=False)
+        
+        return arrays
+    
+    def _build_routes(self, origin: str, destination: str, arrays: Tuple[np.ndarray, ...],
+                      order: np.ndarray) -> List[Dict[str, any]]:
+        """Materialize route detail dicts for the modes selected by order, rounded to 2 decimals"""
+        distance, duration, avg_speed, stops, _ = arrays
+        return [
+            {
+                'distance_km': d,
+                'duration_hours': t,
+                'estimated_stops': n,
+                'average_speed_kmh': v,
+                'route_type': mode,
+                'origin': origin,
+                'destination': destination,
+                'is_predicted': True
+            }
+            for mode, d, t, v, n in zip(self._modes[order].tolist(), np.round(distance[order], 2).tolist(),
+                                        np.round(duration[order], 2).tolist(),
+                                        np.round(avg_speed[order], 2).tolist(), stops[order].tolist())
+        ]
     
     def compare_routes(self, origin: str, destination: str) -> Dict[str, any]:
         """
@@ -194,22 +308,15 @@ class MLRoutePredictor:
         Returns:
             Comparison of all route options
         """
-        all_modes = ['Flight', 'Train', 'Car', 'Bus']
-        routes = []
-        
-        for mode in all_modes:
-            details = self.predict_route_details(origin, destination, mode)
-            routes.append(details)
-        
-        # Sort by duration
-        routes.sort(key=lambda x: x['duration_hours'])
+        arrays = self._compute_arrays(origin, destination)
+        distance, order = arrays[0], arrays[4]
         
         return {
             'origin': origin,
             'destination': destination,
-            'routes': routes,
-            'fastest_mode': routes[0]['route_type'] if routes else None,
-            'shortest_distance': min(r['distance_km'] for r in routes) if routes else 0.0
+            'routes': self._build_routes(origin, destination, arrays, order),
+            'fastest_mode': str(self._modes[order[0]]),
+            'shortest_distance': float(np.round(distance.min(), 2))
         }
     
     def get_route_recommendations(self, origin: str, destination: str,
@@ -228,27 +335,25 @@ class MLRoutePredictor:
         if preferences is None:
             preferences = {'priority': 'speed'}
         
-        all_routes = self.compare_routes(origin, destination)
+        arrays = self._compute_arrays(origin, destination)
+        distance, duration, _, _, order = arrays
         
-        routes = all_routes['routes']
-        
-        # Filter by preferences
+        # Filter by preferences before building any route dicts
+        mask = np.ones(len(_ALL_MODES), dtype=bool)
         if 'max_duration' in preferences:
-            routes = [r for r in routes if r['duration_hours'] <= preferences['max_duration']]
+            mask &= duration <= preferences['max_duration']
         
         if 'max_distance' in preferences:
-            routes = [r for r in routes if r['distance_km'] <= preferences['max_distance']]
+            mask &= distance <= preferences['max_distance']
+        
+        order = order[mask[order]]
         
-        # Sort by priority
+        # Sort by priority; stable sorts keep the duration order for ties
         priority = preferences.get('priority', 'speed')
-        if priority == 'speed':
-            routes.sort(key=lambda x: x['duration_hours'])
-        elif priority == 'distance':
-            routes.sort(key=lambda x: x['distance_km'])
+        if priority == 'distance':
+            order = order[np.argsort(distance[order], kind='stable')]
         elif priority == 'comfort':
-            # Assume Flight > Train > Car > Bus for comfort
-            comfort_order = {'Flight': 4, 'Train': 3, 'Car': 2, 'Bus': 1}
-            routes.sort(key=lambda x: comfort_order.get(x['route_type'], 0), reverse=True)
+            order = order[np.argsort(-self._comfort[order], kind='stable')]
         
-        return routes
+        return self._build_routes(origin, destination, arrays, order)
 
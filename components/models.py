@@ -5,16 +5,37 @@ Contains dataclasses and data structures for trip data, emissions results,
 alternative routes, and geographic locations.
 """
 
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Sequence, Tuple
 from datetime import datetime, date
+import copy
 import json
-from geopy.distance import geodesic
+import math
+import numpy as np
+from ._geo_kernels import haversine_km, haversine_km_array
+
+_VALID_TRAVEL_MODES = frozenset({'Flight', 'Train', 'Car', 'Bus'})
+
+
+# Session state round-trips the same ISO strings on every rerun; date and
+# datetime are immutable, so parsed values can be shared
+@lru_cache(maxsize=256)
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+@lru_cache(maxsize=256)
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
 
 
 @dataclass
 class TripData:
     """User input containing origin, destination, dates, travel modes, and preferences"""
+    __slots__ = ('origin_city', 'destination_city', 'outbound_date', 'return_date',
+                 'travel_modes', 'num_travelers', 'hotel_nights')
+    
     origin_city: str
     destination_city: str
     outbound_date: date
@@ -38,8 +59,7 @@ class TripData:
             return False
         
         # Check travel modes are valid
-        valid_modes = {'Flight', 'Train', 'Car', 'Bus'}
-        if not all(mode in valid_modes for mode in self.travel_modes):
+        if not _VALID_TRAVEL_MODES.issuperset(self.travel_modes):
             return False
         
         # Check that we have either travel modes or hotel nights (or both)
@@ -54,7 +74,16 @@ class TripData:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for session state storage"""
-        data = asdict(self)
+        # Explicit field copies avoid asdict's recursive deep copy
+        data = {
+            'origin_city': self.origin_city,
+            'destination_city': self.destination_city,
+            'outbound_date': self.outbound_date,
+            'return_date': self.return_date,
+            'travel_modes': list(self.travel_modes),
+            'num_travelers': self.num_travelers,
+            'hotel_nights': self.hotel_nights
+        }
         # Convert dates to ISO format strings for JSON serialization (handle both date and string)
         if isinstance(self.outbound_date, date):
             data['outbound_date'] = self.outbound_date.isoformat()
@@ -78,8 +107,8 @@ class TripData:
     def from_dict(cls, data: Dict[str, Any]) -> 'TripData':
         """Create instance from dictionary"""
         # Convert date strings back to date objects
-        outbound_date = date.fromisoformat(data['outbound_date'])
-        return_date = date.fromisoformat(data['return_date']) if data['return_date'] else None
+        outbound_date = _parse_date(data['outbound_date'])
+        return_date = _parse_date(data['return_date']) if data['return_date'] else None
         
         return cls(
             origin_city=data['origin_city'],
@@ -128,7 +157,17 @@ class EmissionsResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for session state storage"""
-        data = asdict(self)
+        # Explicit field copies avoid asdict's recursive deep copy
+        data = {
+            'total_co2e_kg': self.total_co2e_kg,
+            'transport_emissions': dict(self.transport_emissions),
+            'accommodation_emissions': self.accommodation_emissions,
+            'per_person_emissions': self.per_person_emissions,
+            'calculation_timestamp': self.calculation_timestamp,
+            'calculation_warnings': (
+                list(self.calculation_warnings) if self.calculation_warnings is not None else None
+            )
+        }
         # Convert datetime to ISO format string (handle both datetime and string)
         if isinstance(self.calculation_timestamp, datetime):
             data['calculation_timestamp'] = self.calculation_timestamp.isoformat()
@@ -146,7 +185,7 @@ class EmissionsResult:
         # Convert timestamp string back to datetime object (handle both string and datetime)
         timestamp = data.get('calculation_timestamp')
         if isinstance(timestamp, str):
-            calculation_timestamp = datetime.fromisoformat(timestamp)
+            calculation_timestamp = _parse_datetime(timestamp)
         elif isinstance(timestamp, datetime):
             calculation_timestamp = timestamp
         else:
@@ -166,6 +205,9 @@ class EmissionsResult:
 @dataclass
 class AlternativeRoute:
     """Suggested travel option with different mode, time, cost, and emissions"""
+    __slots__ = ('transport_mode', 'duration_hours', 'distance_km', 'co2e_emissions_kg',
+                 'estimated_cost_inr', 'emissions_savings_kg', 'cost_difference_inr', 'route_details')
+    
     transport_mode: str
     duration_hours: float
     distance_km: float
@@ -183,7 +225,17 @@ class AlternativeRoute:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for session state storage"""
-        return asdict(self)
+        return {
+            'transport_mode': self.transport_mode,
+            'duration_hours': self.duration_hours,
+            'distance_km': self.distance_km,
+            'co2e_emissions_kg': self.co2e_emissions_kg,
+            'estimated_cost_inr': self.estimated_cost_inr,
+            'emissions_savings_kg': self.emissions_savings_kg,
+            'cost_difference_inr': self.cost_difference_inr,
+            # route_details can hold nested step lists, so it still gets a deep copy
+            'route_details': copy.deepcopy(self.route_details)
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AlternativeRoute':
@@ -191,24 +243,60 @@ class AlternativeRoute:
         return cls(**data)
 
 
-@dataclass
+@dataclass(frozen=True)
 class GeographicLocation:
     """Geographic location data for Indian cities"""
+    __slots__ = ('city_name', 'state', 'latitude', 'longitude', 'popular_destinations')
+    
     city_name: str
     state: str
     latitude: float
     longitude: float
-    popular_destinations: List[str]
+    popular_destinations: Sequence[str]
+    
+    def calculate_distance_to(self, other: 'GeographicLocation', exact: bool = False) -> float:
+        """Calculate great-circle distance to another location (ellipsoidal geodesic if exact=True)"""
+        if exact:
+            # geopy is only needed for the exact path; importing it lazily keeps it off app startup
+            from geopy.distance import geodesic
+            point1 = (self.latitude, self.longitude)
+            point2 = (other.latitude, other.longitude)
+            return geodesic(point1, point2).kilometers
+        
+        return haversine_km(
+            math.radians(self.latitude), math.radians(self.longitude),
+            math.radians(other.latitude), math.radians(other.longitude)
+        )
     
-    def calculate_distance_to(self, other: 'GeographicLocation') -> float:
-        """Calculate geodesic distance to another location"""
-        point1 = (self.latitude, self.longitude)
-        point2 = (other.latitude, other.longitude)
-        return geodesic(point1, point2).kilometers
+    def distance_to_many(self, latitudes: Sequence[float], longitudes: Sequence[float]) -> np.ndarray:
+        """Great-circle distances in kilometers to many points given in degrees"""
+        return haversine_km_array(
+            math.radians(self.latitude), math.radians(self.longitude),
+            np.radians(np.asarray(latitudes, dtype=float)), np.radians(np.asarray(longitudes, dtype=float))
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for session state storage"""
-        return asdict(self)
+        return {
+            'city_name': self.city_name,
+            'state': self.state,
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            # Same container type as asdict: lists are copied, immutable tuples shared
+            'popular_destinations': (
+                list(self.popular_destinations) if isinstance(self.popular_destinations, list)
+                else tuple(self.popular_destinations)
+            )
+        }
+    
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """Slot values for copy and pickle (slotted classes have no __dict__)"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restore slot values, bypassing the frozen __setattr__"""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GeographicLocation':
@@ -5,6 +5,7 @@ Processes route data to extract time, distance, and mode information,
 calculates emissions for alternatives, and estimates costs with savings analysis.
 """
 
+import numpy as np
 from typing import Dict, List, Any, Optional
 from .ml_route_predictor import MLRoutePredictor
 from .carbon_calculator import CarbonCalculator
@@ -284,34 +285,23 @@ class RouteAnalyzer:
         if not alternatives:
             return {}
         
+        # One (N, 4) array of emissions, cost, duration and distance per alternative
+        values = np.fromiter(
+            (value for alt in alternatives
+             for value in (alt.co2e_emissions_kg, alt.estimated_cost_inr, alt.duration_hours, alt.distance_km)),
+            dtype=np.float64, count=4 * len(alternatives)
+        ).reshape(-1, 4)
+        mins = values.min(axis=0).tolist()
+        maxs = values.max(axis=0).tolist()
+        # Round averages for readability
+        avgs = [round(avg, 2) for avg in values.mean(axis=0).tolist()]
+        
         analysis = {
             'total_alternatives': len(alternatives),
-            'modes_available': list(set(alt.transport_mode for alt in alternatives)),
-            'emissions_range': {
-                'min': min(alt.co2e_emissions_kg for alt in alternatives),
-                'max': max(alt.co2e_emissions_kg for alt in alternatives),
-                'avg': sum(alt.co2e_emissions_kg for alt in alternatives) / len(alternatives)
-            },
-            'cost_range': {
-                'min': min(alt.estimated_cost_inr for alt in alternatives),
-                'max': max(alt.estimated_cost_inr for alt in alternatives),
-                'avg': sum(alt.estimated_cost_inr for alt in alternatives) / len(alternatives)
-            },
-            'duration_range': {
-                'min': min(alt.duration_hours for alt in alternatives),
-                'max': max(alt.duration_hours for alt in alternatives),
-                'avg': sum(alt.duration_hours for alt in alternatives) / len(alternatives)
-            },
-            'distance_range': {
-                'min': min(alt.distance_km for alt in alternatives),
-                'max': max(alt.distance_km for alt in alternatives),
-                'avg': sum(alt.distance_km for alt in alternatives) / len(alternatives)
-            }
+            'modes_available': list({alt.transport_mode for alt in alternatives})
         }
-        
-        # Round averages for readability
-        for category in ['emissions_range', 'cost_range', 'duration_range', 'distance_range']:
-            analysis[category]['avg'] = round(analysis[category]['avg'], 2)
+        for column, category in enumerate(('emissions_range', 'cost_range', 'duration_range', 'distance_range')):
+            analysis[category] = {'min': mins[column], 'max': maxs[column], 'avg': avgs[column]}
         
         return analysis
     
@@ -6,8 +6,7 @@ to optimize for distance, time, and carbon emissions.
 """
 
 from typing import Dict, List, Tuple, Optional, Any
-from geopy.distance import geodesic
-from .geographic_data import GeographicDataManager
+from .geographic_data import get_default_manager
 import logging
 
 
@@ -15,7 +14,7 @@ class RouteOptimizer:
     """Optimizes routes by finding intermediate cities and generating alternate paths"""
     
     def __init__(self):
-        self.geo_manager = GeographicDataManager()
+        self.geo_manager = get_default_manager()
         
         # Predefined intermediate cities for popular routes (can be extended)
         # Format: (origin, destination): [list of intermediate cities]
@@ -80,6 +79,7 @@ class RouteOptimizer:
         # Get all cities
         all_cities = self.geo_manager.get_all_cities()
         intermediate_candidates = []
+        total_dist = self.geo_manager.calculate_geodesic_distance(origin, destination)
         
         # Calculate perpendicular distance from each city to the route line
         for city_name in all_cities:
@@ -109,9 +109,8 @@ class RouteOptimizer:
             
             # Calculate perpendicular distance from city to route line
             # Using point-to-line distance formula
-            dist_to_origin = geodesic(origin_coords, city_coords).kilometers
-            dist_to_dest = geodesic(city_coords, dest_coords).kilometers
-            total_dist = geodesic(origin_coords, dest_coords).kilometers
+            dist_to_origin = self.geo_manager.calculate_geodesic_distance(origin, city_name)
+            dist_to_dest = self.geo_manager.calculate_geodesic_distance(city_name, destination)
             
             # City should not be too far from the route
             # Accept cities within 50km perpendicular distance
@@ -264,23 +263,18 @@ class RouteOptimizer:
     def calculate_route_distance(self, origin: str, destination: str, 
                                 waypoints: List[str]) -> float:
         """Calculate total distance for a route with waypoints"""
-        total_distance = 0.0
         route_path = [origin] + waypoints + [destination]
         
-        for i in range(len(route_path) - 1):
-            segment_distance = self.geo_manager.calculate_geodesic_distance(
-                route_path[i], route_path[i + 1]
-            )
-            if segment_distance:
-                total_distance += segment_distance
-            else:
-                # Fallback: use straight-line distance
-                coords1 = self.geo_manager.get_city_coordinates(route_path[i])
-                coords2 = self.geo_manager.get_city_coordinates(route_path[i + 1])
-                if coords1 and coords2:
-                    total_distance += geodesic(coords1, coords2).kilometers
+        # Segments touching an unknown city have no coordinates and contribute nothing
+        segments = [
+            (start, end) for start, end in zip(route_path[:-1], route_path[1:])
+            if self.geo_manager.validate_city_names(start) and self.geo_manager.validate_city_names(end)
+        ]
+        if not segments:
+            return 0.0
         
-        return total_distance
+        starts, ends = zip(*segments)
+        return float(self.geo_manager.calculate_distances_bulk(starts, ends).sum())
     
     def get_route_coordinates(self, origin: str, destination: str, 
                              waypoints: List[str]) -> List[Tuple[float, float]]:
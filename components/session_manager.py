@@ -6,10 +6,22 @@ and calculation results throughout the application session.
 """
 
 import streamlit as st
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, List
 from .models import TripData, EmissionsResult, AlternativeRoute
 
 
+@dataclass(frozen=True)
+class SessionSnapshot:
+    """Read-only view of the session data, captured once per script run"""
+    __slots__ = ('trip', 'emissions', 'alternatives', 'summary')
+    
+    trip: Dict[str, Any]
+    emissions: Dict[str, Any]
+    alternatives: List[Dict[str, Any]]
+    summary: Dict[str, Any]
+
+
 class SessionStateManager:
     """Manages session state for the EcoTrip Planner application"""
     
@@ -149,14 +161,39 @@ class SessionStateManager:
     @staticmethod
     def get_session_summary() -> Dict[str, Any]:
         """Get a summary of current session state for debugging"""
+        return SessionStateManager._build_summary(
+            SessionStateManager.get_trip_data(),
+            SessionStateManager.get_emissions_data(),
+            SessionStateManager.get_alternatives_data(),
+            SessionStateManager.is_calculation_in_progress()
+        )
+    
+    @staticmethod
+    def snapshot() -> SessionSnapshot:
+        """Read trip, emissions and alternatives data in a single pass over session state"""
+        trip_data = SessionStateManager.get_trip_data()
+        emissions_data = SessionStateManager.get_emissions_data()
+        alternatives_data = SessionStateManager.get_alternatives_data()
+        summary = SessionStateManager._build_summary(
+            trip_data,
+            emissions_data,
+            alternatives_data,
+            SessionStateManager.is_calculation_in_progress()
+        )
+        return SessionSnapshot(trip_data, emissions_data, alternatives_data, summary)
+    
+    @staticmethod
+    def _build_summary(trip_data: Dict[str, Any], emissions_data: Dict[str, Any],
+                       alternatives_data: List[Dict[str, Any]], in_progress: bool) -> Dict[str, Any]:
+        """Build the session summary from already-fetched session values"""
         return {
-            'has_trip_data': SessionStateManager.has_trip_data(),
-            'has_emissions_data': SessionStateManager.has_emissions_data(),
-            'has_alternatives_data': SessionStateManager.has_alternatives_data(),
-            'calculation_in_progress': SessionStateManager.is_calculation_in_progress(),
-            'trip_data_keys': list(SessionStateManager.get_trip_data().keys()),
-            'emissions_data_keys': list(SessionStateManager.get_emissions_data().keys()),
-            'alternatives_count': len(SessionStateManager.get_alternatives_data())
+            'has_trip_data': bool(trip_data and 'origin_city' in trip_data and 'destination_city' in trip_data),
+            'has_emissions_data': bool(emissions_data and 'total_co2e_kg' in emissions_data),
+            'has_alternatives_data': bool(alternatives_data),
+            'calculation_in_progress': in_progress,
+            'trip_data_keys': list(trip_data.keys()),
+            'emissions_data_keys': list(emissions_data.keys()),
+            'alternatives_count': len(alternatives_data)
         }
     
     @staticmethod
@@ -1242,11 +1242,11 @@ class VisualizationComponents:
             from streamlit_folium import st_folium
             
             # Get coordinates for origin and destination
-            from .geographic_data import GeographicDataManager
+            from .geographic_data import get_default_manager
             from .route_optimizer import RouteOptimizer
             from .carbon_calculator import CarbonCalculator
             
-            geo_manager = GeographicDataManager()
+            geo_manager = get_default_manager()
             route_optimizer = RouteOptimizer()
             carbon_calculator = CarbonCalculator()
             
@@ -8,6 +8,7 @@ Validates: Requirements 2.1, 2.2, 6.2, 6.4, 6.5
 import pytest
 from hypothesis import given, strategies as st, settings, HealthCheck
 from unittest.mock import Mock, patch, MagicMock
+import json
 import requests
 import sys
 import os
@@ -15,7 +16,7 @@ import os
 # Add the project root to the path so we can import components
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from components.api_client import APIClientManager
+from components.api_client import APIClientManager, RateLimited, _TRANSPORT_RETRY, _TransportRetry
 
 
 class TestAPIIntegrationWithFallback:
@@ -27,6 +28,11 @@ class TestAPIIntegrationWithFallback:
         with patch.dict(os.environ, {'CLIMATIQ_API_KEY': 'test_key'}):
             self.api_client = APIClientManager()
     
+    def _reset_rate_limit_window(self):
+        """Start each hypothesis example with a fresh per-minute request budget"""
+        for request_times in self.api_client._request_times.values():
+            request_times.clear()
+    
     @given(st.sampled_from(['Flight', 'Train', 'Car', 'Bus', 'Hotel']))
     @settings(suppress_health_check=[HealthCheck.too_slow])
     def test_api_fallback_mechanism(self, transport_mode):
@@ -63,14 +69,74 @@ class TestAPIIntegrationWithFallback:
             # Should return API data when available
             assert emission_factor == 0.123
     
+    @given(st.sampled_from(['Flight', 'Train', 'Car', 'Bus']), st.floats(min_value=1.0, max_value=3000.0))
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    def test_emission_factor_cache_reuses_api_data(self, transport_mode, distance_km):
+        """
+        Property 4: API Integration with Fallback
+        Repeated lookups for the same mode and distance should be served from cache
+        """
+        self.api_client.clear_emission_cache()
+        
+        with patch.object(self.api_client, 'query_climatiq_api', return_value={'co2e': 0.321}) as mock_query:
+            first = self.api_client.get_emission_factor_with_fallback(transport_mode, distance_km)
+            second = self.api_client.get_emission_factor_with_fallback(transport_mode, distance_km)
+            
+            assert first == second == 0.321
+            assert mock_query.call_count == 1
+            
+            # Clearing the cache forces a fresh API lookup
+            self.api_client.clear_emission_cache()
+            self.api_client.get_emission_factor_with_fallback(transport_mode, distance_km)
+            assert mock_query.call_count == 2
+    
+    @given(st.lists(
+        st.tuples(st.sampled_from(['Flight', 'Train', 'Car', 'Bus']), st.floats(min_value=1.0, max_value=3000.0)),
+        min_size=1, max_size=10, unique=True
+    ))
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    def test_batch_emission_factors_single_request(self, lookups):
+        """
+        Property 4: API Integration with Fallback
+        A batch of lookups should cost one API call and map results back by position
+        """
+        self.api_client.clear_emission_cache()
+        batch_response = {'results': [{'co2e': float(i)} for i in range(len(lookups))]}
+        
+        with patch.object(self.api_client, 'query_climatiq_api', return_value=batch_response) as mock_query:
+            factors = self.api_client.get_emission_factors_batch(lookups)
+            
+            assert mock_query.call_count == 1
+            assert mock_query.call_args[0][0] == 'estimate/batch'
+            for i, lookup in enumerate(lookups):
+                assert factors[lookup] == float(i)
+    
+    @given(st.lists(st.sampled_from(['Flight', 'Train', 'Car', 'Bus', 'Hotel']), min_size=1, max_size=5, unique=True))
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    def test_batch_emission_factors_fallback(self, modes):
+        """
+        Property 4: API Integration with Fallback
+        When the batch request fails, every lookup should fall back to static data
+        """
+        self.api_client.clear_emission_cache()
+        lookups = [(mode, 100.0) for mode in modes]
+        
+        with patch.object(self.api_client, 'query_climatiq_api', return_value=None):
+            factors = self.api_client.get_emission_factors_batch(lookups)
+            
+            for mode, distance in lookups:
+                assert factors[(mode, distance)] == self.api_client.static_emission_factors[mode]
+    
     @given(st.integers(min_value=1, max_value=5))
     def test_retry_logic_exhaustion(self, max_retries):
         """
         Property 4: API Integration with Fallback
         For any number of retries, system should eventually give up and return None
         """
+        self._reset_rate_limit_window()
+        
         # Mock persistent API failure
-        with patch('requests.post', side_effect=requests.exceptions.ConnectionError()):
+        with patch('requests.Session.post', side_effect=requests.exceptions.ConnectionError()):
             result = self.api_client.query_climatiq_api('test', {}, max_retries=max_retries)
             
             # Should return None after exhausting retries
@@ -83,15 +149,18 @@ class TestAPIIntegrationWithFallback:
         Property 4: API Integration with Fallback
         For any number of initial failures, system should succeed when API becomes available
         """
+        self._reset_rate_limit_window()
+        
         # Mock initial failures followed by success
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {'co2e': 0.456}
+        mock_response.content = json.dumps({'co2e': 0.456}).encode()
         mock_response.raise_for_status.return_value = None
         
         side_effects = [requests.exceptions.ConnectionError()] * failure_count + [mock_response]
         
-        with patch('requests.post', side_effect=side_effects):
+        with patch('requests.Session.post', side_effect=side_effects):
             result = self.api_client.query_climatiq_api('test', {}, max_retries=failure_count + 1)
             
             # Should eventually succeed
@@ -109,13 +178,92 @@ class TestAPIIntegrationWithFallback:
         mock_response.status_code = status_code
         mock_response.headers = {'Retry-After': '1'}
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with patch('time.sleep') as mock_sleep:  # Mock sleep to speed up test
                 result = self.api_client.query_climatiq_api('test', {}, max_retries=1)
                 
                 # Should return None after rate limit
                 assert result is None
     
+    def test_transport_retry_after_is_capped(self):
+        """
+        Property 4: API Integration with Fallback
+        A long server-requested Retry-After wait should be capped
+        """
+        response = Mock()
+        response.headers = {'Retry-After': '3600'}
+        response.getheader.return_value = '3600'
+        
+        assert _TRANSPORT_RETRY.get_retry_after(response) == _TransportRetry.RETRY_AFTER_MAX
+    
+    def test_transport_retries_count_against_rate_limit(self):
+        """
+        Property 4: API Integration with Fallback
+        Each transport-level retry should be recorded in the API's request window
+        """
+        self._reset_rate_limit_window()
+        adapter = self.api_client._session.get_adapter(self.api_client.climatiq_base_url + '/estimate')
+        
+        adapter.max_retries.increment('POST', '/estimate')
+        
+        assert len(self.api_client._request_times['climatiq']) == 1
+        assert len(self.api_client._request_times['google_maps']) == 0
+    
+    def test_rate_limited_request_raises(self):
+        """
+        Property 4: API Integration with Fallback
+        An exhausted client-side budget should be reported distinctly, and the
+        emission factor lookup should still fall back to static data
+        """
+        for _ in range(self.api_client.climatiq_rate_limit):
+            self.api_client._update_rate_limit_tracking('climatiq')
+        
+        with patch('requests.Session.post') as mock_post:
+            with pytest.raises(RateLimited):
+                self.api_client.query_climatiq_api('estimate', {})
+            mock_post.assert_not_called()
+            
+            self.api_client.clear_emission_cache()
+            factor = self.api_client.get_emission_factor_with_fallback('Train')
+            assert factor == self.api_client.static_emission_factors['Train']
+    
+    def test_rate_limited_directions_fall_back_with_warning(self):
+        """
+        Property 4: API Integration with Fallback
+        A skipped Google Maps request should produce a fallback route that says it was rate limited
+        """
+        self.api_client.google_maps_api_key = 'AIza_test_key'
+        for _ in range(self.api_client.google_maps_rate_limit):
+            self.api_client._update_rate_limit_tracking('google_maps')
+        
+        with patch('requests.Session.get') as mock_get:
+            routes = self.api_client._fetch_mode_routes('Delhi', 'Mumbai', 'Car', 'driving')
+            mock_get.assert_not_called()
+        
+        assert len(routes) == 1
+        assert routes[0]['is_fallback'] is True
+        assert any('rate limit' in warning.lower() for warning in routes[0]['warnings'])
+    
+    def test_google_maps_params_not_mutated(self):
+        """
+        Property 4: API Integration with Fallback
+        Querying Google Maps should not add the API key to the caller's params
+        """
+        self.api_client.google_maps_api_key = 'AIza_test_key'
+        params = {'origin': 'Delhi', 'destination': 'Mumbai'}
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'status': 'OK', 'routes': []}
+        mock_response.content = json.dumps({'status': 'OK', 'routes': []}).encode()
+        mock_response.raise_for_status.return_value = None
+        
+        with patch('requests.Session.get', return_value=mock_response) as mock_get:
+            self.api_client.query_google_maps_api('directions/json', params)
+            
+            assert params == {'origin': 'Delhi', 'destination': 'Mumbai'}
+            assert mock_get.call_args[1]['params']['key'] == 'AIza_test_key'
+    
     @given(st.text(min_size=1, max_size=50))
     def test_missing_api_key_fallback(self, endpoint):
         """
@@ -141,8 +289,10 @@ class TestAPIIntegrationWithFallback:
         Property 4: API Integration with Fallback
         For any timeout scenario, system should handle gracefully
         """
+        self._reset_rate_limit_window()
+        
         # Mock timeout exception
-        with patch('requests.post', side_effect=requests.exceptions.Timeout()):
+        with patch('requests.Session.post', side_effect=requests.exceptions.Timeout()):
             result = self.api_client.query_climatiq_api('test', {}, max_retries=1)
             
             # Should return None on timeout
@@ -155,13 +305,16 @@ class TestAPIIntegrationWithFallback:
         Property 4: API Integration with Fallback
         For any malformed response, system should handle gracefully
         """
+        self._reset_rate_limit_window()
+        
         # Mock response without required fields
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_response.raise_for_status.return_value = None
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             # Should not crash on malformed response
             try:
                 result = self.api_client.query_climatiq_api('test', {})
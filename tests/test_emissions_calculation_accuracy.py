@@ -17,6 +17,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from components.models import TripData
 from components.carbon_calculator import CarbonCalculator
+from components.ml_emissions_model import MLEmissionsPredictor
 
 
 # Hypothesis strategies for generating test data
@@ -270,6 +271,61 @@ class TestEmissionsCalculationAccuracy:
         for invalid_distance in invalid_distances:
             assert self.calculator.validate_calculation_inputs(trip_data, invalid_distance) == False
 
+    @given(st.lists(st.sampled_from(['Flight', 'Train', 'Car', 'Bus', 'Hotel', 'Ferry']), min_size=1, max_size=6),
+           st.floats(min_value=1.0, max_value=5000.0),
+           st.integers(min_value=1, max_value=20))
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    def test_batch_emission_factors_match_single_predictions(self, modes, distance_km, num_travelers):
+        """
+        Property 3: Emissions Calculation Accuracy - Batch Factor Consistency
+        For any list of modes, batch-predicted factors should match one-at-a-time predictions
+        """
+        predictor = self.calculator.ml_predictor
+        factors = predictor.predict_emission_factors_batch(modes, distance_km, num_travelers)
+        
+        assert factors.shape == (len(modes),)
+        for factor, mode in zip(factors.tolist(), modes):
+            assert factor == predictor.predict_emission_factor(mode, distance_km, num_travelers)
+
+    @given(st.lists(
+        st.tuples(
+            st.sampled_from(['Flight', 'Train', 'Car', 'Bus', 'Hotel', 'Ferry']),
+            st.floats(min_value=-10.0, max_value=5000.0)
+        ),
+        min_size=1, max_size=20
+    ))
+    def test_vectorized_emission_factors_match_single_predictions(self, mode_distances):
+        """
+        Property 3: Emissions Calculation Accuracy - Vectorized Factor Consistency
+        For any (mode, distance) pairs, vectorized factors should match one-at-a-time predictions
+        """
+        predictor = self.calculator.ml_predictor
+        modes, distances = zip(*mode_distances)
+        factors = predictor.predict_emission_factors_vec(modes, distances)
+        
+        assert factors.shape == (len(modes),)
+        for factor, mode, distance in zip(factors.tolist(), modes, distances):
+            assert abs(factor - predictor.predict_emission_factor(mode, distance)) <= 1e-12
+
+    
+    def test_reassigned_base_factors_update_predictions(self):
+        """
+        Property 3: Emissions Calculation Accuracy - Factor Table Consistency
+        Scalar and vectorized predictions should follow reassigned base factors,
+        and in-place edits should be rejected rather than silently ignored
+        """
+        predictor = MLEmissionsPredictor()
+        factors = predictor._factors_as_dict()
+        factors['Train']['base'] = 0.05
+        predictor.base_emission_factors = factors
+        
+        expected = 0.05 * 0.95
+        assert abs(predictor.predict_emission_factor('Train', 100.0) - expected) <= 1e-12
+        assert abs(predictor.predict_emission_factors_vec(['Train'], [100.0])[0] - expected) <= 1e-12
+        
+        with pytest.raises(TypeError):
+            predictor.base_emission_factors['Train']['base'] = 0.1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
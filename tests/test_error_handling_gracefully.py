@@ -46,7 +46,7 @@ class TestErrorHandlingGracefully:
         api_client = APIClientManager()
         
         # Mock requests to raise the error
-        with patch('requests.post') as mock_post, patch('requests.get') as mock_get:
+        with patch('requests.Session.post') as mock_post, patch('requests.Session.get') as mock_get:
             mock_post.side_effect = error_types
             mock_get.side_effect = error_types
             
@@ -265,7 +265,7 @@ class TestErrorHandlingGracefully:
         
         simulated_error = error_mapping.get(network_conditions, requests.exceptions.RequestException("Network error"))
         
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.side_effect = simulated_error
             
             # Test API call with network error
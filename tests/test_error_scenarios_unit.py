@@ -28,7 +28,7 @@ class TestAPIFailureHandling:
         """Test Climatiq API connection error handling"""
         api_client = APIClientManager()
         
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
             
             result = api_client.query_climatiq_api('estimate', {'test': 'data'})
@@ -45,7 +45,7 @@ class TestAPIFailureHandling:
         """Test Google Maps API timeout error handling"""
         api_client = APIClientManager()
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
             
             result = api_client.query_google_maps_api('directions/json', {'origin': 'Delhi', 'destination': 'Mumbai'})
@@ -63,7 +63,7 @@ class TestAPIFailureHandling:
         """Test Climatiq API authentication error (401)"""
         api_client = APIClientManager()
         
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_response = Mock()
             mock_response.status_code = 401
             mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("401 Unauthorized")
@@ -82,7 +82,7 @@ class TestAPIFailureHandling:
         """Test Google Maps API rate limit error (429)"""
         api_client = APIClientManager()
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 429
             mock_response.headers = {'Retry-After': '60'}
@@ -97,7 +97,7 @@ class TestAPIFailureHandling:
         """Test API server error (500) handling"""
         api_client = APIClientManager()
         
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_response = Mock()
             mock_response.status_code = 500
             mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Internal Server Error")
@@ -302,7 +302,7 @@ class TestNetworkConnectivityIssues:
         """Test DNS resolution failure handling"""
         api_client = APIClientManager()
         
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.side_effect = requests.exceptions.ConnectionError("DNS resolution failed")
             
             result = api_client.query_climatiq_api('estimate', {'test': 'data'})
@@ -318,7 +318,7 @@ class TestNetworkConnectivityIssues:
         """Test SSL certificate error handling"""
         api_client = APIClientManager()
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = requests.exceptions.SSLError("SSL certificate verification failed")
             
             result = api_client.query_google_maps_api('directions/json', {'test': 'params'})
@@ -330,7 +330,7 @@ class TestNetworkConnectivityIssues:
         """Test proxy connection error handling"""
         api_client = APIClientManager()
         
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.side_effect = requests.exceptions.ProxyError("Proxy connection failed")
             
             result = api_client.query_climatiq_api('estimate', {'test': 'data'})
@@ -349,7 +349,7 @@ class TestNetworkConnectivityIssues:
         ]
         
         for timeout_error in timeout_errors:
-            with patch('requests.post') as mock_post:
+            with patch('requests.Session.post') as mock_post:
                 mock_post.side_effect = timeout_error
                 
                 result = api_client.query_climatiq_api('estimate', {'test': 'data'})
@@ -363,7 +363,7 @@ class TestNetworkConnectivityIssues:
         
         # Test that the API client handles connection errors gracefully
         # and provides fallback mechanisms
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
             
             result = api_client.query_climatiq_api('estimate', {'test': 'data'})
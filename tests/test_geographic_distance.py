@@ -13,11 +13,14 @@ from hypothesis import given, strategies as st, settings, HealthCheck
 import sys
 import os
 import math
+import copy
+import pickle
 
 # Add the project root to the path so we can import components
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from components.geographic_data import GeographicDataManager
+from components.geographic_data import GeographicDataManager, get_default_manager, normalize_city_name
+from components._geo_kernels import haversine_km
 from components.models import GeographicLocation
 
 
@@ -168,13 +171,42 @@ class TestGeographicDistanceCalculation:
         """
         suggestions = self.geo_manager.get_city_suggestions(partial_name)
         
-        # All suggestions should contain the partial name (case insensitive)
+        # All suggestions should contain the partial name (case and accent insensitive)
         for suggestion in suggestions:
-            assert partial_name.lower() in suggestion.lower()
+            assert normalize_city_name(partial_name) in normalize_city_name(suggestion)
         
         # Should return at most 5 suggestions
         assert len(suggestions) <= 5
     
+    @given(st.one_of(
+        st.sampled_from(['sal', 'chen', 'PUR', 'bad', 'abad', 'nagar', 'ore', 'Delhi', 'xyz']),
+        st.text(alphabet='aeinorstuhlmbdgp', min_size=1, max_size=6)
+    ))
+    def test_city_suggestions_match_full_scan(self, partial_name):
+        """
+        Property 5: Geographic Distance Calculation - Indexed Suggestions
+        Indexed suggestions should equal the first five matches of a full substring scan
+        """
+        expected = [
+            city for city in self.geo_manager.get_all_cities()
+            if partial_name.lower() in city.lower()
+        ][:5]
+        
+        assert self.geo_manager.get_city_suggestions(partial_name) == expected
+    
+    @given(st.sampled_from(['Salem', 'Chennai', 'Delhi', 'Mumbai', 'Bangalore', 'Kolkata', 'Hyderabad', 'Pune']))
+    def test_city_suggestions_ignore_case_and_accents(self, city_name):
+        """
+        Property 5: Geographic Distance Calculation - Normalized Suggestions
+        Upper-cased or accented queries should suggest the same cities as the plain name
+        """
+        accented = city_name.replace('e', '\u00e9').replace('a', '\u00e1')
+        expected = self.geo_manager.get_city_suggestions(city_name)
+        
+        assert city_name in expected
+        assert self.geo_manager.get_city_suggestions(city_name.upper()) == expected
+        assert self.geo_manager.get_city_suggestions(accented) == expected
+    
     def test_all_cities_have_coordinates(self):
         """
         Property 5: Geographic Distance Calculation - Complete City Data
@@ -191,6 +223,197 @@ class TestGeographicDistanceCalculation:
             assert isinstance(longitude, (int, float))
             assert not math.isnan(latitude)
             assert not math.isnan(longitude)
+    
+    @given(
+        st.sampled_from(['Salem', 'Chennai', 'Delhi', 'Mumbai', 'Bangalore', 'Kolkata']),
+        st.sampled_from(['Hyderabad', 'Pune', 'Ahmedabad', 'Jaipur', 'Kochi', 'Goa'])
+    )
+    def test_great_circle_matches_exact_geodesic(self, city1, city2):
+        """
+        Property 5: Geographic Distance Calculation - Approximation Accuracy
+        The default great-circle distance should stay within 0.5% of the exact geodesic
+        """
+        approximate = self.geo_manager.calculate_geodesic_distance(city1, city2)
+        exact = self.geo_manager.calculate_geodesic_distance(city1, city2, exact=True)
+        
+        assert approximate is not None and exact is not None
+        assert abs(approximate - exact) <= 0.005 * exact
+    
+    @given(st.lists(
+        st.sampled_from(['Salem', 'Chennai', 'Delhi', 'Mumbai', 'Bangalore', 'Kolkata', 'Hyderabad', 'Pune']),
+        min_size=1, max_size=10
+    ))
+    def test_batch_radian_coordinates_match_scalar_lookup(self, city_names):
+        """
+        Property 5: Geographic Distance Calculation - Batch Coordinate Consistency
+        Batch radian coordinates should match the per-city coordinate lookup
+        """
+        coords_rad = self.geo_manager.get_coords_rad_batch(city_names)
+        
+        assert coords_rad.shape == (len(city_names), 2)
+        for row, city in zip(coords_rad, city_names):
+            latitude, longitude = self.geo_manager.get_city_coordinates(city)
+            assert math.isclose(row[0], math.radians(latitude))
+            assert math.isclose(row[1], math.radians(longitude))
+    
+    @given(st.lists(
+        st.tuples(
+            st.sampled_from(['Salem', 'Chennai', 'Delhi', 'Mumbai', 'Bangalore', 'Kolkata']),
+            st.sampled_from(['Hyderabad', 'Pune', 'Ahmedabad', 'Jaipur', 'Kochi', 'Goa'])
+        ),
+        min_size=1, max_size=10
+    ))
+    def test_bulk_distances_match_pairwise(self, city_pairs):
+        """
+        Property 5: Geographic Distance Calculation - Bulk Consistency
+        Bulk distances should match the one-pair-at-a-time calculation
+        """
+        origins, destinations = zip(*city_pairs)
+        distances = self.geo_manager.calculate_distances_bulk(origins, destinations)
+        
+        assert distances.shape == (len(city_pairs),)
+        for distance, (origin, destination) in zip(distances, city_pairs):
+            expected = self.geo_manager.calculate_geodesic_distance(origin, destination)
+            assert math.isclose(distance, expected, rel_tol=1e-9)
+
+
+    @given(
+        st.sampled_from(['Salem', 'Chennai', 'Delhi', 'Mumbai', 'Bangalore', 'Kolkata']),
+        st.sampled_from(['Hyderabad', 'Pune', 'Ahmedabad', 'Jaipur', 'Kochi', 'Goa'])
+    )
+    def test_precomputed_distance_matches_kernel(self, city1, city2):
+        """
+        Property 5: Geographic Distance Calculation - Precomputed Table Consistency
+        Table lookups should match the scalar haversine kernel on the same coordinates
+        """
+        lat1, lon1 = (math.radians(value) for value in self.geo_manager.get_city_coordinates(city1))
+        lat2, lon2 = (math.radians(value) for value in self.geo_manager.get_city_coordinates(city2))
+        
+        distance = self.geo_manager.calculate_geodesic_distance(city1, city2)
+        
+        assert math.isclose(distance, haversine_km(lat1, lon1, lat2, lon2), rel_tol=1e-9)
+
+
+    @given(
+        st.lists(st.sampled_from(['Salem', 'Chennai', 'Delhi', 'Mumbai', 'Bangalore', 'Kolkata']), min_size=1, max_size=4),
+        st.lists(st.sampled_from(['Hyderabad', 'Pune', 'Ahmedabad', 'Jaipur', 'Kochi', 'Goa']), min_size=1, max_size=4)
+    )
+    def test_distance_matrix_matches_pairwise(self, origins, destinations):
+        """
+        Property 5: Geographic Distance Calculation - Distance Matrix Consistency
+        Every matrix entry should match the distance for that origin/destination pair
+        """
+        matrix = self.geo_manager.calculate_distance_matrix(origins, destinations)
+        
+        assert matrix.shape == (len(origins), len(destinations))
+        for i, origin in enumerate(origins):
+            for j, destination in enumerate(destinations):
+                expected = self.geo_manager.calculate_geodesic_distance(origin, destination)
+                assert math.isclose(matrix[i, j], expected, rel_tol=1e-9)
+    
+    @given(st.sampled_from(['Salem', 'Chennai', 'Delhi', 'Mumbai', 'Bangalore', 'Kolkata', 'Hyderabad', 'Pune']),
+           st.integers(min_value=1, max_value=10))
+    def test_nearest_cities_sorted_and_include_self(self, city_name, k):
+        """
+        Property 5: Geographic Distance Calculation - Nearest Cities
+        Nearest cities to a city's own coordinates should start at distance 0 and be sorted by distance
+        """
+        latitude, longitude = self.geo_manager.get_city_coordinates(city_name)
+        nearest = self.geo_manager.nearest_cities(latitude, longitude, k)
+        
+        assert len(nearest) == k
+        assert nearest[0][1] == 0.0
+        assert city_name in [name for name, distance in nearest if distance == 0.0]
+        distances = [distance for _, distance in nearest]
+        assert distances == sorted(distances)
+    
+    @given(st.sampled_from(['Salem', 'Chennai', 'Delhi', 'Mumbai', 'Bangalore', 'Kolkata', 'Hyderabad', 'Pune']))
+    def test_distance_to_many_matches_pairwise(self, city_name):
+        """
+        Property 5: Geographic Distance Calculation - One-to-Many Consistency
+        Batch distances from a location should match pairwise distances to each city
+        """
+        location = self.geo_manager.get_city_info(city_name)
+        cities = self.geo_manager.get_all_cities()
+        others = [self.geo_manager.get_city_info(city) for city in cities]
+        
+        batch = location.distance_to_many([o.latitude for o in others], [o.longitude for o in others])
+        from_point = self.geo_manager.distances_from_point(location.latitude, location.longitude)
+        
+        assert batch.shape == (len(cities),)
+        for i, other in enumerate(others):
+            expected = location.calculate_distance_to(other)
+            assert math.isclose(batch[i], expected, rel_tol=1e-9, abs_tol=1e-9)
+            assert math.isclose(from_point[i], expected, rel_tol=1e-9, abs_tol=1e-9)
+    
+    @given(st.sampled_from(['Salem', 'Chennai', 'Delhi', 'Mumbai', 'Bangalore', 'Kolkata', 'Hyderabad', 'Pune']))
+    def test_distance_from_city_matches_pairwise(self, city_name):
+        """
+        Property 5: Geographic Distance Calculation - City Distance Row
+        Distances from a city to all cities should match pairwise lookups
+        """
+        row = self.geo_manager.distance_from(city_name)
+        cities = self.geo_manager.get_all_cities()
+        
+        assert row.shape == (len(cities),)
+        for i, other in enumerate(cities):
+            assert math.isclose(row[i], self.geo_manager.calculate_geodesic_distance(city_name, other),
+                                rel_tol=1e-9, abs_tol=1e-9)
+        
+        row[:] = -1.0
+        assert self.geo_manager.calculate_geodesic_distance(city_name, cities[0]) >= 0.0
+        assert self.geo_manager.distance_from('InvalidCity') is None
+    
+    @given(st.lists(st.text(min_size=1, max_size=10), max_size=3), st.booleans())
+    def test_location_dict_round_trip(self, destinations, as_tuple):
+        """
+        Property 5: Geographic Distance Calculation - Location Serialization
+        Converting a location to a dict and back should give an equal location
+        """
+        popular = tuple(destinations) if as_tuple else list(destinations)
+        location = GeographicLocation('Salem', 'Tamil Nadu', 11.6643, 78.146, popular)
+        
+        data = location.to_dict()
+        
+        assert type(data['popular_destinations']) is type(popular)
+        assert GeographicLocation.from_dict(data) == location
+        if not as_tuple:
+            assert data['popular_destinations'] is not popular
+    
+    @given(st.sampled_from(['Salem', 'Mumbai', 'Delhi', 'Chennai']))
+    def test_location_copy_and_pickle_round_trip(self, city_name):
+        """
+        Property 5: Geographic Distance Calculation - Location Copying
+        Copying or pickling a location should give an equal location
+        """
+        location = self.geo_manager.get_city_info(city_name)
+        
+        assert copy.copy(location) == location
+        assert copy.deepcopy(location) == location
+        assert pickle.loads(pickle.dumps(location)) == location
+    
+    def test_popular_route_distances_precomputed(self):
+        """
+        Property 5: Geographic Distance Calculation - Popular Route Distances
+        Every popular route should have a precomputed distance equal to the on-demand calculation
+        """
+        for origin, destination in self.geo_manager.get_popular_routes():
+            expected = self.geo_manager.calculate_geodesic_distance(origin, destination)
+            assert self.geo_manager.get_popular_route_distance(origin, destination) == expected
+        
+        assert self.geo_manager.get_popular_route_distance('Salem', 'InvalidCity') is None
+
+
+    def test_default_manager_is_shared(self):
+        """
+        Property 5: Geographic Distance Calculation - Shared Manager
+        The default manager should be one shared instance with the same city data
+        """
+        manager = get_default_manager()
+        
+        assert isinstance(manager, GeographicDataManager)
+        assert get_default_manager() is manager
+        assert manager.get_all_cities() == self.geo_manager.get_all_cities()
 
 
 class TestDualInputMethodSupport:
@@ -252,7 +475,7 @@ class TestDualInputMethodSupport:
         
         # Suggestions should contain the partial input (case insensitive)
         for suggestion in suggestions:
-            assert partial_input.lower() in suggestion.lower()
+            assert normalize_city_name(partial_input) in normalize_city_name(suggestion)
         
         # Should not exceed maximum suggestion count
         assert len(suggestions) <= 5
@@ -439,10 +439,10 @@ class TestErrorRecoveryWorkflows:
         SessionStateManager.initialize_session()
         
         # Mock network connectivity issues
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = ConnectionError("Network unreachable")
             
-            with patch('requests.post') as mock_post:
+            with patch('requests.Session.post') as mock_post:
                 mock_post.side_effect = ConnectionError("Network unreachable")
                 
                 # Application should still function with cached/static data
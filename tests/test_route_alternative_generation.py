@@ -9,9 +9,11 @@ import pytest
 from hypothesis import given, strategies as st, assume, settings, HealthCheck
 from components.api_client import APIClientManager
 from components.route_analyzer import RouteAnalyzer
+from components.ml_route_predictor import MLRoutePredictor
 from components.models import TripData, AlternativeRoute
 from datetime import date, timedelta
 import os
+from unittest.mock import patch
 
 
 class TestRouteAlternativeGeneration:
@@ -254,4 +256,194 @@ class TestRouteAlternativeGeneration:
         # Property: Should contain warning about fallback
         warnings = fallback_route.get('warnings', [])
         assert any('fallback' in warning.lower() or 'estimation' in warning.lower() for warning in warnings), \
-            "Should contain warning about fallback estimation"
\ No newline at end of file
+            "Should contain warning about fallback estimation"
+    
+    @given(
+        mode=st.sampled_from(['Car', 'Bus', 'Train']),
+        distance_m=st.integers(min_value=1000, max_value=3000000),
+        duration_s=st.integers(min_value=60, max_value=200000)
+    )
+    @settings(max_examples=50)
+    def test_directions_processing_is_memoized(self, mode, distance_m, duration_s):
+        """
+        Property: Processing the same directions response twice should reuse the parsed routes
+        **Feature: ecotrip-planner, Property 6: Route Alternative Generation**
+        """
+        response = {
+            'status': 'OK',
+            'routes': [{
+                'legs': [{
+                    'distance': {'value': distance_m},
+                    'duration': {'value': duration_s},
+                    'start_address': 'Delhi',
+                    'end_address': 'Mumbai',
+                    'steps': []
+                }],
+                'overview_polyline': {'points': f'poly_{distance_m}_{duration_s}'}
+            }]
+        }
+        
+        with patch.object(self.api_client, '_parse_directions_routes',
+                          wraps=self.api_client._parse_directions_routes) as mock_parse:
+            first = self.api_client._process_directions_response(response, mode)
+            second = self.api_client._process_directions_response(response, mode)
+            
+            assert first == second
+            assert first[0]['distance_km'] == distance_m / 1000.0
+            assert mock_parse.call_count <= 1
+    
+    @given(
+        origin=st.sampled_from(['Delhi', 'Mumbai', 'Chennai', 'Bangalore', 'Kolkata', 'Hyderabad', 'Pune', 'Ahmedabad']),
+        destination=st.sampled_from(['Delhi', 'Mumbai', 'Chennai', 'Bangalore', 'Kolkata', 'Hyderabad', 'Pune', 'Ahmedabad'])
+    )
+    @settings(max_examples=30)
+    def test_compare_routes_matches_per_mode_predictions(self, origin, destination):
+        """
+        Property: The vectorized route comparison should agree with single-mode predictions
+        **Feature: ecotrip-planner, Property 6: Route Alternative Generation**
+        """
+        predictor = MLRoutePredictor()
+        comparison = predictor.compare_routes(origin, destination)
+        direct = predictor.geo_manager.calculate_distance(origin, destination)
+        
+        assert len(comparison['routes']) == 4
+        for route in comparison['routes']:
+            mode = route['route_type']
+            assert route == predictor.predict_route_details(origin, destination, mode)
+            assert route['distance_km'] == predictor.predict_distance(origin, destination, mode)
+            assert route['duration_hours'] == predictor.predict_duration(origin, destination, mode)
+            
+            expected_distance = round(direct * predictor.route_efficiency[mode], 2) if direct > 0 else 0.0
+            assert abs(route['distance_km'] - expected_distance) <= 0.01
+        
+        durations = [r['duration_hours'] for r in comparison['routes']]
+        assert durations == sorted(durations)
+    
+    def test_compare_routes_is_cached_and_isolated(self):
+        """
+        Property: Repeated comparisons should reuse the cached result without sharing mutable routes
+        **Feature: ecotrip-planner, Property 6: Route Alternative Generation**
+        """
+        predictor = MLRoutePredictor()
+        
+        with patch.object(predictor.geo_manager, 'calculate_distance',
+                          wraps=predictor.geo_manager.calculate_distance) as mock_distance:
+            first = predictor.compare_routes('Delhi', 'Mumbai')
+            first['routes'].clear()
+            second = predictor.compare_routes('Delhi', 'Mumbai')
+            recommendations = predictor.get_route_recommendations('Delhi', 'Mumbai', {'priority': 'distance'})
+            third = predictor.compare_routes('Delhi', 'Mumbai')
+            
+            assert mock_distance.call_count == 1
+        
+        assert len(second['routes']) == 4
+        assert len(recommendations) == 4
+        assert second == third
+    
+    @given(
+        candidates=st.lists(
+            st.tuples(
+                st.sampled_from(['Delhi', 'Mumbai', 'Chennai', 'Bangalore', 'Kolkata', 'Pune']),
+                st.sampled_from(['Delhi', 'Mumbai', 'Chennai', 'Bangalore', 'Kolkata', 'Pune']),
+                st.sampled_from(['Flight', 'Train', 'Car', 'Bus', 'Ferry'])
+            ),
+            min_size=1,
+            max_size=20
+        )
+    )
+    @settings(max_examples=30)
+    def test_batch_route_predictions_match_single(self, candidates):
+        """
+        Property: Batch predictions should match single-candidate predictions
+        **Feature: ecotrip-planner, Property 6: Route Alternative Generation**
+        """
+        predictor = MLRoutePredictor()
+        origins, destinations, modes = (list(column) for column in zip(*candidates))
+        
+        distances, durations = predictor.predict_routes_batch(origins, destinations, modes)
+        
+        assert distances.shape == durations.shape == (len(candidates),)
+        for i, (origin, destination, mode) in enumerate(candidates):
+            assert distances[i] == predictor.predict_distance(origin, destination, mode)
+            assert durations[i] == predictor.predict_duration(origin, destination, mode)
+    
+    @given(
+        origin=st.sampled_from(['Delhi', 'Mumbai', 'Chennai', 'Bangalore', 'InvalidCity']),
+        destination=st.sampled_from(['Delhi', 'Mumbai', 'Chennai', 'Bangalore', 'InvalidCity']),
+        modes=st.lists(st.sampled_from(['Flight', 'Train', 'Car', 'Bus', 'Ferry']), max_size=5, unique=True)
+    )
+    @settings(max_examples=50)
+    def test_predicted_alternatives_match_single_mode(self, origin, destination, modes):
+        """
+        Property: Predicted alternatives should match single-mode predictions and skip empty routes
+        **Feature: ecotrip-planner, Property 6: Route Alternative Generation**
+        """
+        predictor = MLRoutePredictor()
+        alternatives = predictor.predict_alternative_routes(origin, destination, modes)
+        
+        expected_modes = [m for m in modes if predictor.predict_distance(origin, destination, m) > 0]
+        assert [a['mode'] for a in alternatives] == expected_modes
+        for alternative in alternatives:
+            mode = alternative['mode']
+            assert alternative['distance_km'] == predictor.predict_distance(origin, destination, mode)
+            assert alternative['duration_hours'] == predictor.predict_duration(origin, destination, mode)
+    
+    @given(
+        origin=st.sampled_from(['Delhi', 'Mumbai', 'Chennai', 'Bangalore', 'Pune']),
+        destination=st.sampled_from(['Delhi', 'Mumbai', 'Chennai', 'Bangalore', 'Pune']),
+        priority=st.sampled_from(['speed', 'distance', 'comfort', 'cost']),
+        max_duration=st.one_of(st.none(), st.floats(min_value=0.0, max_value=40.0)),
+        max_distance=st.one_of(st.none(), st.floats(min_value=0.0, max_value=3000.0))
+    )
+    @settings(max_examples=50)
+    def test_route_recommendations_match_filtered_comparison(self, origin, destination, priority,
+                                                             max_duration, max_distance):
+        """
+        Property: Recommendations should be the compared routes filtered and sorted by preference
+        **Feature: ecotrip-planner, Property 6: Route Alternative Generation**
+        """
+        predictor = MLRoutePredictor()
+        preferences = {'priority': priority}
+        if max_duration is not None:
+            preferences['max_duration'] = max_duration
+        if max_distance is not None:
+            preferences['max_distance'] = max_distance
+        
+        expected = predictor.compare_routes(origin, destination)['routes']
+        if max_duration is not None:
+            expected = [r for r in expected if r['duration_hours'] <= max_duration]
+        if max_distance is not None:
+            expected = [r for r in expected if r['distance_km'] <= max_distance]
+        if priority == 'distance':
+            expected.sort(key=lambda r: r['distance_km'])
+        elif priority == 'comfort':
+            comfort_order = {'Flight': 4, 'Train': 3, 'Car': 2, 'Bus': 1}
+            expected.sort(key=lambda r: comfort_order[r['route_type']], reverse=True)
+        
+        assert predictor.get_route_recommendations(origin, destination, preferences) == expected
+    
+    @given(
+        pairs=st.lists(
+            st.tuples(
+                st.sampled_from(['Delhi', 'Mumbai', 'Chennai', 'Bangalore', 'Kolkata', 'Pune']),
+                st.sampled_from(['Delhi', 'Mumbai', 'Chennai', 'Bangalore', 'Kolkata', 'Pune']),
+                st.sampled_from(['Flight', 'Train', 'Car', 'Bus', 'Ferry'])
+            ),
+            max_size=20
+        )
+    )
+    @settings(max_examples=30)
+    def test_predict_many_matches_route_details(self, pairs):
+        """
+        Property: Scoring many tuples at once should match per-tuple route details
+        **Feature: ecotrip-planner, Property 6: Route Alternative Generation**
+        """
+        predictor = MLRoutePredictor()
+        predictions = predictor.predict_many(pairs)
+        
+        assert predictions.shape == (len(pairs),)
+        for record, (origin, destination, mode) in zip(predictions, pairs):
+            details = predictor.predict_route_details(origin, destination, mode)
+            assert record['distance_km'] == details['distance_km']
+            assert record['duration_hours'] == details['duration_hours']
+            assert record['estimated_stops'] == details['estimated_stops']
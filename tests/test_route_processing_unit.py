@@ -353,4 +353,22 @@ class TestCostEstimationUnit:
         # All base costs should be reasonable
         assert 200 <= base_costs['Flight'] <= 1000   # Airport taxes
         assert 0 <= base_costs['Train'] <= 200       # Reservation fees
-        assert 0 <= base_costs['Bus'] <= 100         # Booking fees
\ No newline at end of file
+        assert 0 <= base_costs['Bus'] <= 100         # Booking fees
+    
+    def test_route_efficiency_analysis_ranges(self):
+        """Test that efficiency analysis reports min, max and rounded average per metric"""
+        alternatives = [
+            AlternativeRoute('Train', 16.0, 1380.0, 45.5, 1856.0, 120.0, -500.0, {}),
+            AlternativeRoute('Bus', 24.5, 1420.0, 60.25, 3650.0, 105.25, 1294.0, {}),
+            AlternativeRoute('Car', 28.0, 1450.0, 170.0, 8700.0, -4.25, 6344.0, {})
+        ]
+        
+        analysis = self.route_analyzer.analyze_route_efficiency(alternatives)
+        
+        assert analysis['total_alternatives'] == 3
+        assert sorted(analysis['modes_available']) == ['Bus', 'Car', 'Train']
+        assert analysis['emissions_range'] == {'min': 45.5, 'max': 170.0, 'avg': round(275.75 / 3, 2)}
+        assert analysis['cost_range'] == {'min': 1856.0, 'max': 8700.0, 'avg': round(14206.0 / 3, 2)}
+        assert analysis['duration_range'] == {'min': 16.0, 'max': 28.0, 'avg': round(68.5 / 3, 2)}
+        assert analysis['distance_range'] == {'min': 1380.0, 'max': 1450.0, 'avg': 1416.67}
+        assert self.route_analyzer.analyze_route_efficiency([]) == {}
@@ -299,6 +299,29 @@ class TestSessionStatePersistence:
         assert SessionStateManager.get_alternatives_data() == []
         assert SessionStateManager.is_calculation_in_progress() == False
 
+    
+    @given(trip_data_strategy(), st.lists(alternative_route_strategy(), min_size=0, max_size=5))
+    @settings(suppress_health_check=[HealthCheck.too_slow])
+    def test_snapshot_matches_individual_getters(self, trip_data, alternatives_list):
+        """
+        Property 2: Session State Persistence - Snapshot Consistency
+        A session snapshot should expose the same data as the individual getters
+        """
+        SessionStateManager.initialize_session()
+        SessionStateManager.store_trip_data(trip_data.to_dict())
+        SessionStateManager.store_alternatives_data([alt.to_dict() for alt in alternatives_list])
+        
+        snapshot = SessionStateManager.snapshot()
+        
+        assert snapshot.trip == SessionStateManager.get_trip_data()
+        assert snapshot.emissions == SessionStateManager.get_emissions_data()
+        assert snapshot.alternatives == SessionStateManager.get_alternatives_data()
+        assert snapshot.summary == SessionStateManager.get_session_summary()
+        
+        # Snapshots are read-only
+        with pytest.raises(AttributeError):
+            snapshot.trip = {}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file